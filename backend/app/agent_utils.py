@@ -4,41 +4,69 @@ from __future__ import annotations
 
 from .schedule_state import SCHEDULE_MANAGER
 
+# include_teachers -> (schedule version, formatted context) from the last build
+_context_cache: dict[bool, tuple[int, str]] = {}
+
 
 def format_schedule_context() -> str:
-    """Format the current schedule state as context for the agent."""
-    state = SCHEDULE_MANAGER.get_state()
+    """Format the current schedule state as context for the agent.
 
-    # Summary of teachers and their loads
-    teacher_summaries = []
-    for teacher_id, teacher_data in state["teachers"].items():
-        teacher = SCHEDULE_MANAGER.state.teachers[teacher_id]
-        load = SCHEDULE_MANAGER.compute_teacher_load(teacher)
-        utilization = (
-            (load / teacher_data["max_load_hours"] * 100)
-            if teacher_data["max_load_hours"] > 0
-            else 0
-        )
-        qualified_courses = ", ".join(teacher_data["qualified_courses"])
-        teacher_summaries.append(
-            f"- {teacher_data['name']} (qualified: {qualified_courses}): "
-            f"{load:.1f}/{teacher_data['max_load_hours']:.1f} hours ({utilization:.1f}%)"
-        )
+    The text is memoized until the schedule changes.
+    """
+    return _cached_context(include_teachers=True)
+
+
+def format_schedule_summary() -> str:
+    """Short form of :func:`format_schedule_context` without per-teacher lines.
+
+    Its size does not grow with the number of teachers; the agent fetches
+    details through its tools when it needs them.
+    """
+    return _cached_context(include_teachers=False)
+
+
+def _cached_context(include_teachers: bool) -> str:
+    version = SCHEDULE_MANAGER.version
+    cached = _context_cache.get(include_teachers)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    context = _build_schedule_context(include_teachers)
+    _context_cache[include_teachers] = (version, context)
+    return context
+
+
+def _build_schedule_context(include_teachers: bool = True) -> str:
+    """Render the schedule context text from the current state."""
+    state = SCHEDULE_MANAGER.get_state()
 
     # Count of sections and assignments
     total_sections = len(state["sections"])
-    assigned_sections = len([a for a in state["assignments"].values() if a["teacher_id"]])
-    unassigned_sections = total_sections - assigned_sections
+    assigned_sections = SCHEDULE_MANAGER.assigned_count()
+    unassigned_sections = SCHEDULE_MANAGER.unassigned_count()
+
+    parts = [
+        "Current Schedule State",
+        f"Total Sections: {total_sections} (Assigned: {assigned_sections}, Unassigned: {unassigned_sections})",
+    ]
+
+    if include_teachers:
+        # Summary of teachers and their loads
+        loads = SCHEDULE_MANAGER.compute_all_loads()
+        parts.append("Teacher Workloads:")
+        teacher_load_line = SCHEDULE_MANAGER.teacher_load_line
+        parts.extend(
+            teacher_load_line(teacher_id, loads[teacher_id]) for teacher_id in state["teachers"]
+        )
+    else:
+        parts.append(f"Teachers: {len(state['teachers'])}, Rooms: {len(state['rooms'])}")
 
     # Recent timeline entries
+    parts.append("Recent Changes:")
     timeline = state["timeline"][:3]
-    recent = "\n".join(f"  * {entry['entry']} ({entry['timestamp']})" for entry in timeline)
-
-    return (
-        "Current Schedule State\n"
-        f"Total Sections: {total_sections} (Assigned: {assigned_sections}, Unassigned: {unassigned_sections})\n"
-        "Teacher Workloads:\n"
-        f"{chr(10).join(teacher_summaries)}\n"
-        "Recent Changes:\n"
-        f"{recent or '  * No recent changes recorded.'}"
-    )
+    if timeline:
+        parts.extend(f"  * {entry['entry']} ({entry['timestamp']})" for entry in timeline)
+    else:
+        parts.append("  * No recent changes recorded.")
+
+    return "\n".join(parts)
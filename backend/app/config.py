@@ -5,8 +5,10 @@ This module provides a centralized configuration system that reads from environm
 variables and .env files, with validation and type safety.
 """
 
+from functools import lru_cache
+
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -50,23 +52,38 @@ class Settings(BaseSettings):
         default=None, ge=1, le=32000, description="Maximum tokens in model response"
     )
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
+    )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance, parsing the environment on first use."""
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get the global settings instance."""
-    return settings
+# Provided by __getattr__ below
+settings: Settings
+AGENT_BACKEND: str
+
+
+def __getattr__(name: str):
+    # ``settings`` and ``AGENT_BACKEND`` are resolved lazily so importing this
+    # module does not read the environment or .env file
+    if name == "settings":
+        return get_settings()
+    if name == "AGENT_BACKEND":
+        return get_settings().AGENT_BACKEND
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_llm_config():
     """Get LLM configuration from settings (backward compatibility)."""
+    settings = get_settings()
     return {
         "model": settings.OPENAI_MODEL,
         "openai_api_key": settings.OPENAI_API_KEY,
@@ -75,28 +92,21 @@ def get_llm_config():
 
 
 def get_app():
-    """Lazy import of the app to avoid circular dependencies."""
-    if settings.AGENT_BACKEND == "langgraph":
-        from .langgraph_server import app
+    """Get the app for the configured backend.
 
-        return app
-    elif settings.AGENT_BACKEND == "openai":
-        from .openai_server import app
+    Delegates to ``settings.get_app`` (what ``main`` uses), so both entry
+    points share one cached app and never build a server twice.
+    """
+    from .settings import get_app as _get_app
 
-        return app
-    else:
-        raise ValueError(f"Unknown agent backend: {settings.AGENT_BACKEND}")
+    return _get_app()
 
 
 def reload_settings() -> Settings:
     """Reload settings from environment variables and return new instance."""
-    global settings
-    settings = Settings()
-    return settings
-
+    get_settings.cache_clear()
+    return get_settings()
 
-# Backward compatibility
-AGENT_BACKEND = settings.AGENT_BACKEND
 
 # Export functions and settings
 __all__ = [
@@ -3,19 +3,103 @@ Core tool functions that are backend-agnostic.
 Both OpenAI and LangGraph tools can call these functions.
 """
 
-from typing import Any
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
+
 from .schedule_state import SCHEDULE_MANAGER
 
+logger = logging.getLogger(__name__)
+
+# Charts are only ever written to files; never probe for a GUI backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Chart PNGs are encoded off the request path, one at a time
+_PLOT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plot")
+
+# (Figure, FigureCanvasAgg), imported on first render; see _get_figure_api()
+_figure_api: tuple[type, type] | None = None
+
+# (PNG path, render future) of the most recently requested chart
+_last_render: tuple[str, Future] | None = None
+
+
+# (function name, *args) -> (schedule version, result) for the read-only tools
+_result_cache: dict[tuple, tuple[int, Any]] = {}
+
+
+def _version_memoize(fn: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Reuse ``fn``'s result for the same arguments until the schedule changes.
+
+    Keyed on ``SCHEDULE_MANAGER.version``, which every mutation bumps. The
+    cached dicts are shared between callers and must be treated as read-only.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any) -> dict[str, Any]:
+        key = (name, *args)
+        version = SCHEDULE_MANAGER.version
+        cached = _result_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        result = fn(*args)
+        _result_cache[key] = (version, result)
+        return result
+
+    return wrapper
+
 
+def _exclusive(fn: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Run ``fn`` under the schedule lock.
+
+    For tools that check the state and then change it: FastAPI's threadpool
+    and the LangGraph tool pool may run several of them at once.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any) -> dict[str, Any]:
+        with SCHEDULE_MANAGER.lock:
+            return fn(*args)
+
+    return wrapper
+
+
+def _charts_enabled() -> bool:
+    """Whether chart images should be rendered (ENABLE_CHARTS, default on)."""
+    return os.getenv("ENABLE_CHARTS", "1") == "1"
+
+
+def _get_figure_api() -> tuple[type, type]:
+    """Import matplotlib's Figure API once, on first use.
+
+    Text-only deployments (ENABLE_CHARTS=0) never import matplotlib at all.
+    """
+    global _figure_api
+    if _figure_api is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _figure_api = (Figure, FigureCanvasAgg)
+    return _figure_api
+
+
+@_version_memoize
 def core_show_schedule_overview() -> dict[str, Any]:
     """Core logic for schedule overview - backend agnostic."""
     state = SCHEDULE_MANAGER.get_state()
+    loads = SCHEDULE_MANAGER.compute_all_loads()
 
     # Add computed loads for teachers
     teacher_loads = {}
     for teacher_id, teacher_data in state["teachers"].items():
-        teacher = SCHEDULE_MANAGER.state.teachers[teacher_id]
-        load = SCHEDULE_MANAGER.compute_teacher_load(teacher)
+        load = loads[teacher_id]
         teacher_loads[teacher_id] = {
             "name": teacher_data["name"],
             "current_load": load,
@@ -34,33 +118,95 @@ def core_show_schedule_overview() -> dict[str, Any]:
     }
 
 
-def core_show_load_distribution() -> dict[str, Any]:
-    """Core logic for load distribution analysis."""
-    import matplotlib.pyplot as plt
-    import tempfile
-    import os
+def _render_hist_png(counts: np.ndarray, edges: np.ndarray, img_path: str) -> None:
+    """Draw pre-binned load counts as a histogram PNG.
+
+    Uses the Figure API directly rather than pyplot, so no global figure
+    manager is involved and the figure is freed once it goes out of scope.
+    """
+    Figure, FigureCanvasAgg = _get_figure_api()
 
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.hist(edges[:-1], bins=edges, weights=counts, alpha=0.7, edgecolor="black")
+    ax.set_title("Teaching Load Distribution (hours)")
+    ax.set_xlabel("Hours")
+    ax.set_ylabel("Count")
+    FigureCanvasAgg(fig)
+    fig.savefig(img_path, bbox_inches="tight")
+
+
+def _log_render_failure(img_path: str, future: Future) -> None:
+    error = future.exception()
+    if error is not None:
+        logger.error("Rendering load histogram %s failed: %s", img_path, error, exc_info=error)
+
+
+def _ensure_chart(img_path: str, histogram: dict[str, list]) -> None:
+    """Queue a render of ``img_path`` unless one is pending or already succeeded.
+
+    A failed render, or a PNG that has since been removed, is rendered again
+    on the next call, even though the bins themselves stay memoized.
+    """
+    global _last_render
+    last = _last_render
+    if last is not None and last[0] == img_path:
+        future = last[1]
+        if not future.done():
+            return
+        if future.exception() is None and os.path.exists(img_path):
+            return
+
+    counts = np.asarray(histogram["counts"])
+    edges = np.asarray(histogram["edges"])
+    future = _PLOT_POOL.submit(_render_hist_png, counts, edges, img_path)
+    future.add_done_callback(functools.partial(_log_render_failure, img_path))
+    _last_render = (img_path, future)
+
+
+def core_show_load_distribution() -> dict[str, Any]:
+    """Core logic for load distribution analysis.
+
+    The bins are returned directly; the PNG is rendered in the background and
+    may not exist yet when this returns. Repeat calls on an unchanged schedule
+    reuse the result and only render again if the last render failed or its
+    file has been removed.
+    """
+    result = _load_distribution(_charts_enabled())
+    img_path = result.get("histogram_path")
+    if img_path:
+        _ensure_chart(img_path, result["histogram"])
+    return result
+
+
+@_version_memoize
+def _load_distribution(charts_enabled: bool) -> dict[str, Any]:
+    all_loads = SCHEDULE_MANAGER.compute_all_loads()
     loads = {
-        teacher.name: SCHEDULE_MANAGER.compute_teacher_load(teacher)
-        for teacher in SCHEDULE_MANAGER.state.teachers.values()
+        teacher.name: all_loads[teacher_id]
+        for teacher_id, teacher in SCHEDULE_MANAGER.state.teachers.items()
     }
 
     try:
-        fig = plt.figure(figsize=(10, 6))
-        plt.hist(list(loads.values()), bins=5, alpha=0.7, edgecolor="black")
-        plt.title("Teaching Load Distribution (hours)")
-        plt.xlabel("Hours")
-        plt.ylabel("Count")
+        counts, edges = np.histogram(list(loads.values()), bins=5)
+        histogram = {"counts": counts.tolist(), "edges": edges.tolist()}
+
+        if not charts_enabled:
+            return {
+                "message": "Load distribution computed (charts disabled).",
+                "loads": loads,
+                "histogram": histogram,
+            }
 
-        tmpdir = tempfile.gettempdir()
-        img_path = os.path.join(tmpdir, "load_hist.png")
-        fig.savefig(img_path, bbox_inches="tight")
-        plt.close(fig)
+        # Named after the binned data, so a path never shows another schedule's chart
+        digest = hashlib.sha1(counts.tobytes() + edges.tobytes()).hexdigest()[:16]
+        img_path = os.path.join(tempfile.gettempdir(), f"load_hist_{digest}.png")
 
         return {
             "message": "Load distribution computed.",
             "loads": loads,
             "histogram_path": img_path,
+            "histogram": histogram,
         }
     except Exception as e:
         return {
@@ -70,64 +216,71 @@ def core_show_load_distribution() -> dict[str, Any]:
         }
 
 
+def _overload_violations() -> dict[str, Any]:
+    teachers = SCHEDULE_MANAGER.state.teachers
+    violations = [
+        {
+            "teacher_id": tid,
+            "teacher": teachers[tid].name,
+            "load": load,
+            "max": max_load,
+        }
+        for (tid, load, max_load) in SCHEDULE_MANAGER.find_overload()
+    ]
+    return {"type": "overload", "violations": violations}
+
+
+def _conflict_violations() -> dict[str, Any]:
+    teachers = SCHEDULE_MANAGER.state.teachers
+    violations = [
+        {
+            "teacher_id": tid,
+            "teacher": teachers[tid].name,
+            "section_id": sid,
+        }
+        for (tid, sid) in SCHEDULE_MANAGER.find_conflicting_assignments()
+    ]
+    return {"type": "conflict", "violations": violations}
+
+
+# violation type -> handler building that type's report
+_VIOLATION_HANDLERS: dict[str, Callable[[], dict[str, Any]]] = {
+    "overload": _overload_violations,
+    "conflict": _conflict_violations,
+}
+
+
+@_version_memoize
 def core_show_violations(violation_type: str) -> dict[str, Any]:
     """Core logic for showing violations."""
-    if violation_type == "overload":
-        overloads = SCHEDULE_MANAGER.find_overload()
-        violations = [
-            {
-                "teacher_id": tid,
-                "teacher": SCHEDULE_MANAGER.state.teachers[tid].name,
-                "load": load,
-                "max": max_load,
-            }
-            for (tid, load, max_load) in overloads
-        ]
-        return {"type": "overload", "violations": violations}
-    elif violation_type == "conflict":
-        conflicts = SCHEDULE_MANAGER.find_conflicting_assignments()
-        violations = [
-            {
-                "teacher_id": tid,
-                "teacher": SCHEDULE_MANAGER.state.teachers[tid].name,
-                "section_id": sid,
-            }
-            for (tid, sid) in conflicts
-        ]
-        return {"type": "conflict", "violations": violations}
-    else:
+    handler = _VIOLATION_HANDLERS.get(violation_type)
+    if handler is None:
         return {"error": "Unknown violation type. Use 'overload' or 'conflict'."}
+    return handler()
 
 
+@_exclusive
 def core_rebalance(max_load_hours: float = None) -> dict[str, Any]:
     """Core logic for rebalancing workloads."""
-    # Snapshot the serialized state before running the rebalancer.
-    old_snapshot = SCHEDULE_MANAGER.get_state()
+    # Snapshot only the assignment -> teacher mapping before running the rebalancer.
+    old_snapshot = SCHEDULE_MANAGER.snapshot_assignment_teachers()
 
     # Run the OR-Tools optimal rebalancer (it mutates the in-memory state).
     SCHEDULE_MANAGER.optimal_rebalance(max_load_hours)
 
     # Take a new snapshot after rebalancing.
-    new_snapshot = SCHEDULE_MANAGER.get_state()
+    new_snapshot = SCHEDULE_MANAGER.snapshot_assignment_teachers()
 
-    # Find differences by comparing serialized assignment teacher_ids.
+    # Find differences by comparing assignment teacher_ids.
+    teachers = SCHEDULE_MANAGER.state.teachers
     diffs: list[dict[str, str | None]] = []
-    for sid, old_assignment in old_snapshot["assignments"].items():
-        old_tid = old_assignment.get("teacher_id")
-        new_tid = new_snapshot["assignments"][sid].get("teacher_id")
+    for sid, old_tid in old_snapshot.items():
+        new_tid = new_snapshot.get(sid)
         if old_tid != new_tid:
-            old_name = old_snapshot["teachers"][old_tid]["name"] if old_tid else None
-            new_name = new_snapshot["teachers"][new_tid]["name"] if new_tid else None
+            old_name = teachers[old_tid].name if old_tid else None
+            new_name = teachers[new_tid].name if new_tid else None
             diffs.append({"section_id": sid, "from": old_name, "to": new_name})
 
-    # Get loads after rebalancing for summary
-    after_loads = {}
-    for teacher_id, teacher in SCHEDULE_MANAGER.state.teachers.items():
-        after_loads[teacher_id] = {
-            "name": teacher.name,
-            "load": SCHEDULE_MANAGER.compute_teacher_load(teacher),
-        }
-
     if not diffs:
         return {
             "success": True,
@@ -142,6 +295,7 @@ def core_rebalance(max_load_hours: float = None) -> dict[str, Any]:
     }
 
 
+@_exclusive
 def core_swap(section_id: str, from_teacher: str, to_teacher: str) -> dict[str, Any]:
     """Core logic for swapping section assignments."""
     from_teacher_id = SCHEDULE_MANAGER.teacher_name_to_id(from_teacher)
@@ -164,29 +318,32 @@ def core_swap(section_id: str, from_teacher: str, to_teacher: str) -> dict[str,
     }
 
 
+@_version_memoize
 def core_show_unassigned() -> dict[str, Any]:
     """Core logic for finding unassigned sections."""
-    state = SCHEDULE_MANAGER.get_state()
-
     unassigned_sections = []
-    for assignment_id, assignment in state["assignments"].items():
-        if assignment["teacher_id"] is None:
-            section = state["sections"][assignment["section_id"]]
-            # Calculate weekly hours from timeslots
-            weekly_hours = sum(
-                slot["end_hour"] - slot["start_hour"] for slot in section["timeslots"]
-            )
+    if SCHEDULE_MANAGER.unassigned_count() == 0:
+        return {
+            "message": "Found 0 unassigned section(s)",
+            "unassigned_sections": unassigned_sections,
+        }
+
+    # Read the in-memory objects; only the unassigned sections get serialized
+    sections = SCHEDULE_MANAGER.state.sections
+    for assignment in SCHEDULE_MANAGER.state.assignments.values():
+        if assignment.teacher_id is None:
+            section = sections[assignment.section_id]
             # Format timeslots as human-readable strings
             timeslot_strings = [
-                f"{slot['day'].name}: {slot['start_hour']:.0f}:00-{slot['end_hour']:.0f}:00"
-                for slot in section["timeslots"]
+                f"{slot.day.name}: {slot.start_hour:.0f}:00-{slot.end_hour:.0f}:00"
+                for slot in section.timeslots
             ]
             unassigned_sections.append(
                 {
-                    "section_id": assignment["section_id"],
-                    "course_code": section["course_code"],
-                    "enrollment": section["enrollment"],
-                    "weekly_hours": weekly_hours,
+                    "section_id": assignment.section_id,
+                    "course_code": section.course_code,
+                    "enrollment": section.enrollment,
+                    "weekly_hours": section.duration_hours,
                     "timeslots": timeslot_strings,
                 }
             )
@@ -197,36 +354,39 @@ def core_show_unassigned() -> dict[str, Any]:
     }
 
 
+@_exclusive
 def core_assign_section(section_id: str, teacher: str) -> dict[str, Any]:
     """Core logic for assigning a section to a teacher."""
-    state = SCHEDULE_MANAGER.get_state()
+    manager = SCHEDULE_MANAGER
+    state = manager.state
+    teachers = state.teachers
 
     # Check if section exists and is unassigned
-    if section_id not in state["assignments"]:
+    assignment = state.assignments.get(section_id)
+    if assignment is None:
         return {"error": f"Section {section_id} not found"}
 
-    assignment = state["assignments"][section_id]
-    if assignment["teacher_id"] is not None:
-        current_teacher = state["teachers"][assignment["teacher_id"]]["name"]
+    if assignment.teacher_id is not None:
+        current_teacher = teachers[assignment.teacher_id].name
         return {"error": f"Section {section_id} is already assigned to {current_teacher}"}
 
     # Find teacher by name or ID
-    teacher_id = SCHEDULE_MANAGER.teacher_name_to_id(teacher)
+    teacher_id = manager.teacher_name_to_id(teacher)
     if not teacher_id:
         return {"error": f"Teacher '{teacher}' not found"}
 
     # Check if teacher is qualified for the course
-    section = state["sections"][section_id]
-    teacher_obj = SCHEDULE_MANAGER.state.teachers[teacher_id]
-    if section["course_code"] not in teacher_obj.qualified_courses:
+    section = state.sections[section_id]
+    teacher_obj = teachers[teacher_id]
+    if section.course_code not in teacher_obj.qualified_courses:
         qualified_courses = ", ".join(teacher_obj.qualified_courses)
         return {
-            "error": f"Teacher {teacher_obj.name} is not qualified to teach {section['course_code']}. Qualified for: {qualified_courses}"
+            "error": f"Teacher {teacher_obj.name} is not qualified to teach {section.course_code}. Qualified for: {qualified_courses}"
         }
 
     # Check if assignment would overload the teacher
-    current_load = SCHEDULE_MANAGER.compute_teacher_load(teacher_obj)
-    section_hours = sum(slot["end_hour"] - slot["start_hour"] for slot in section["timeslots"])
+    current_load = manager.compute_all_loads()[teacher_id]
+    section_hours = section.duration_hours
 
     if current_load + section_hours > teacher_obj.max_load_hours:
         return {
@@ -234,7 +394,7 @@ def core_assign_section(section_id: str, teacher: str) -> dict[str, Any]:
         }
 
     # Make the assignment
-    SCHEDULE_MANAGER.state.assignments[section_id].teacher_id = teacher_id
+    manager.assign_teacher(section_id, teacher_id)
 
     return {
         "success": True,
@@ -249,6 +409,7 @@ def core_assign_section(section_id: str, teacher: str) -> dict[str, Any]:
     }
 
 
+@_exclusive
 def core_reset_schedule() -> dict[str, Any]:
     """Core logic for resetting the schedule to initial state."""
     return SCHEDULE_MANAGER.reset_schedule()
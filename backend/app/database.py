@@ -1,37 +1,109 @@
 """Database configuration and session management."""
 
+import functools
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import (
+    Column,
+    Engine,
+    Float,
+    create_engine,
+    event,
+    func,
+    inspect,
+    make_url,
+    select,
+    update,
+)
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from . import json_utils
+
 # Get database URL from environment or use SQLite for development
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
     "sqlite:///./test.db"
 )
 
-# Create engine based on database type
-if "postgresql" in DATABASE_URL:
-    engine = create_engine(
-        DATABASE_URL,
-        echo=False,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
-    )
-else:
+
+# JSON columns are encoded/decoded with orjson when it is installed
+_JSON_ARGS = {"json_serializer": json_utils.dumps, "json_deserializer": json_utils.loads}
+
+
+@functools.lru_cache(maxsize=1)
+def _engine() -> Engine:
+    """Create the process-wide engine (and its connection pool) on first use."""
+    if "postgresql" in DATABASE_URL:
+        return create_engine(
+            DATABASE_URL,
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20,
+            **_JSON_ARGS,
+        )
     # SQLite for development/testing
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    if make_url(DATABASE_URL).database in (None, "", ":memory:"):
+        # Every connection to an in-memory database is a separate database,
+        # so all sessions must share one connection
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            **_JSON_ARGS,
+        )
+    else:
+        # A real connection pool so reads can proceed in parallel under WAL
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            pool_size=5,
+            max_overflow=10,
+            pool_recycle=1800,
+            **_JSON_ARGS,
+        )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune each new SQLite connection for the insert-heavy chat workload.
+
+    WAL lets readers run alongside the single writer, and synchronous=NORMAL
+    only fsyncs at checkpoints, which is still crash-safe in WAL mode.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.close()
+
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@functools.lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker[Session]:
+    """Build the session factory once, bound to the shared engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=_engine())
 
-# Base class for ORM models
-Base = declarative_base()
+
+def SessionLocal() -> Session:  # noqa: N802 - kept as the historical factory name
+    """Open a new session from the shared, pooled factory."""
+    return _session_factory()()
+
+
+def __getattr__(name: str):
+    # ``engine`` is resolved lazily so importing this module never opens a pool
+    if name == "engine":
+        return _engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class Base(DeclarativeBase):
+    """Base class for ORM models."""
 
 
 def get_db():
@@ -44,5 +116,36 @@ def get_db():
 
 
 def init_db():
-    """Initialize database tables."""
+    """Initialize database tables.
+
+    ``create_all`` only creates missing tables, so columns added to existing
+    tables are applied by :func:`_upgrade_schema` afterwards.
+    """
+    engine = _engine()
     Base.metadata.create_all(bind=engine)
+    _upgrade_schema(engine)
+
+
+def _upgrade_schema(engine: Engine) -> None:
+    """Bring databases created by older versions up to the current models.
+
+    - ``sections.duration_hours``: added and backfilled from the section's
+      timeslots (older rows would otherwise fail every ``Section`` query).
+    """
+    tables = Base.metadata.tables
+    if "sections" not in tables or "timeslots" not in tables:
+        return
+    existing = {column["name"] for column in inspect(engine).get_columns("sections")}
+    if "duration_hours" in existing:
+        return
+
+    sections, timeslots = tables["sections"], tables["timeslots"]
+    column = Column("duration_hours", Float, server_default="0")
+    total = (
+        select(func.coalesce(func.sum(timeslots.c.end_hour - timeslots.c.start_hour), 0.0))
+        .where(timeslots.c.section_id == sections.c.id)
+        .scalar_subquery()
+    )
+    with engine.begin() as connection:
+        Operations(MigrationContext.configure(connection)).add_column("sections", column)
+        connection.execute(update(sections).values(duration_hours=total))
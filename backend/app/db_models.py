@@ -2,7 +2,23 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text, JSON
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    JSON,
+    event,
+    func,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -27,13 +43,25 @@ class ThreadItem(Base):
     """Chat message/item in a thread."""
 
     __tablename__ = "thread_items"
+    # Items are always listed per thread in creation order
+    __table_args__ = (
+        Index("ix_thread_items_thread_created", "thread_id", "created_at"),
+        # Containment/path queries on the item payload (PostgreSQL only)
+        Index(
+            "ix_thread_items_item_data_gin",
+            "item_data",
+            postgresql_using="gin",
+            postgresql_ops={"item_data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(String, primary_key=True, index=True)
-    thread_id = Column(String, ForeignKey("threads.id"), index=True)
+    thread_id = Column(String, ForeignKey("threads.id"))
     role = Column(String)  # user, assistant, system, tool
     content = Column(Text)
     item_type = Column(String)  # UserMessageItem, TextContentPart, etc.
-    item_data = Column(JSON, nullable=True)
+    # JSONB on PostgreSQL: parsed once server-side and indexable; plain JSON elsewhere
+    item_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -135,6 +163,8 @@ class Section(Base):
     course_id = Column(String, ForeignKey("courses.id"), index=True)
     section_number = Column(String)
     enrollment = Column(Integer, default=0)
+    # Maintained from timeslots, see _timeslot_changed below
+    duration_hours = Column(Float, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -148,9 +178,13 @@ class Timeslot(Base):
     """Class timeslot/meeting time model."""
 
     __tablename__ = "timeslots"
+    # Matches conflict checks, which scan a section's slots by day and start time
+    __table_args__ = (
+        Index("ix_timeslot_section_day_start", "section_id", "day", "start_hour"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    section_id = Column(String, ForeignKey("sections.id"), index=True)
+    section_id = Column(String, ForeignKey("sections.id"))
     day = Column(String)  # MONDAY, TUESDAY, etc.
     start_hour = Column(Float)
     end_hour = Column(Float)
@@ -160,14 +194,48 @@ class Timeslot(Base):
     section = relationship("Section", back_populates="timeslots")
 
 
+def _refresh_section_duration(connection, section_id: str | None) -> None:
+    """Recompute the cached weekly duration of a section from its timeslots."""
+    if section_id is None:
+        return
+    timeslots = Timeslot.__table__
+    sections = Section.__table__
+    total = (
+        select(func.coalesce(func.sum(timeslots.c.end_hour - timeslots.c.start_hour), 0.0))
+        .where(timeslots.c.section_id == section_id)
+        .scalar_subquery()
+    )
+    connection.execute(
+        update(sections).where(sections.c.id == section_id).values(duration_hours=total)
+    )
+
+
+@event.listens_for(Timeslot, "after_insert")
+@event.listens_for(Timeslot, "after_update")
+@event.listens_for(Timeslot, "after_delete")
+def _timeslot_changed(mapper, connection, target) -> None:
+    """Keep Section.duration_hours in sync so queries avoid a JOIN + GROUP BY."""
+    _refresh_section_duration(connection, target.section_id)
+    # A timeslot moved to another section also changes the old section's duration
+    for old_section_id in inspect(target).attrs.section_id.history.deleted:
+        if old_section_id != target.section_id:
+            _refresh_section_duration(connection, old_section_id)
+
+
 class Assignment(Base):
     """Teacher-section assignment model."""
 
     __tablename__ = "assignments"
+    # Lookups go by section, by teacher, or by both; each composite also
+    # serves single-column lookups on its leading column
+    __table_args__ = (
+        Index("ix_assignment_teacher_section", "teacher_id", "section_id"),
+        Index("ix_assignment_section_teacher", "section_id", "teacher_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    section_id = Column(String, ForeignKey("sections.id"), index=True)
-    teacher_id = Column(String, ForeignKey("teachers.id"), nullable=True, index=True)
+    section_id = Column(String, ForeignKey("sections.id"))
+    teacher_id = Column(String, ForeignKey("teachers.id"), nullable=True)
     room_id = Column(String, ForeignKey("rooms.id"), nullable=True, index=True)
     assigned_at = Column(DateTime, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -183,6 +251,8 @@ class ScheduleChange(Base):
     """Audit log for schedule changes."""
 
     __tablename__ = "schedule_changes"
+    # Audit views page through a thread's changes in time order
+    __table_args__ = (Index("ix_schedchange_thread_created", "thread_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     change_type = Column(String)  # ASSIGN, SWAP, REBALANCE, etc.
@@ -196,3 +266,18 @@ class ScheduleChange(Base):
     # Relationships
     thread = relationship("Thread")
 
+
+# Export the mapped models; the Timeslot listeners stay private to this module
+__all__ = [
+    "Thread",
+    "ThreadItem",
+    "ToolCall",
+    "Teacher",
+    "Course",
+    "TeacherQualification",
+    "Room",
+    "Section",
+    "Timeslot",
+    "Assignment",
+    "ScheduleChange",
+]
@@ -0,0 +1,58 @@
+"""JSON encoding helpers for tool results.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths return ``str`` and raise ``json.JSONDecodeError`` on
+invalid input (orjson's error type subclasses it).
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# "Z" for UTC datetimes, matching pydantic's JSON output
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if orjson is not None else 0
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types found in schedule dumps (as pydantic's JSON mode does)."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (datetime, date)):
+        # Only reached on the stdlib path; orjson encodes these natively
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string, optionally indented by two spaces."""
+    if orjson is not None:
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_default)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes, e.g. for an HTTP body."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,65 @@
+"""Numeric kernels for schedule analysis.
+
+The kernels operate on flat NumPy arrays (one entry per timeslot) and are
+compiled with Numba, which ships in the optional ``fast`` extra. Uncompiled,
+the per-element loop over NumPy scalars is slower than a plain Python scan,
+so callers check ``NUMBA_AVAILABLE`` and keep a pure-Python path for that case.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def _mark_conflicts(ts_order, ts_teacher, ts_day, ts_start, ts_end, by_slot):
+    """Flag every timeslot that overlaps a slot of an earlier assignment.
+
+    ``by_slot`` lists slot indices sorted by (teacher, day, start), so each
+    slot only has to be compared with the following slots that start before
+    it ends. Of two overlapping slots, the one whose assignment comes later
+    (higher ``ts_order``) is flagged.
+    """
+    n = by_slot.shape[0]
+    flagged = np.zeros(n, dtype=np.bool_)
+    for a in range(n):
+        i = by_slot[a]
+        for b in range(a + 1, n):
+            j = by_slot[b]
+            if ts_teacher[j] != ts_teacher[i] or ts_day[j] != ts_day[i]:
+                break
+            if ts_start[j] >= ts_end[i]:
+                break
+            if ts_start[i] < ts_end[j] and ts_order[i] != ts_order[j]:
+                if ts_order[i] > ts_order[j]:
+                    flagged[i] = True
+                else:
+                    flagged[j] = True
+    return flagged
+
+
+def find_conflicting_slots(
+    ts_order: np.ndarray,
+    ts_teacher: np.ndarray,
+    ts_day: np.ndarray,
+    ts_start: np.ndarray,
+    ts_end: np.ndarray,
+) -> np.ndarray:
+    """Return a boolean mask of timeslots that clash with an earlier assignment."""
+    if ts_order.shape[0] == 0:
+        return np.zeros(0, dtype=np.bool_)
+    by_slot = np.lexsort((ts_start, ts_day, ts_teacher))
+    return _mark_conflicts(ts_order, ts_teacher, ts_day, ts_start, ts_end, by_slot)
@@ -2,30 +2,118 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextvars
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict, Annotated, AsyncIterator
 
 try:
-    from langchain_openai import ChatOpenAI
     from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
+    from langchain_core.runnables import RunnableConfig
     from langgraph.graph import StateGraph
     from langgraph.prebuilt import ToolNode
     from langgraph.graph.message import add_messages
 
+    # Chat roles that are replayed to the model, and their LangChain message type
+    _ROLE_CTOR = {"user": HumanMessage, "assistant": AIMessage}
+
     LANGGRAPH_AVAILABLE = True
 except ImportError:
     LANGGRAPH_AVAILABLE = False
 
-from .langgraph_tools import UNIVERSITY_TOOLS
 from .config import settings, get_llm_config
-from .agent_utils import format_schedule_context
+from . import json_utils
 from .langgraph_decorators import get_lg_tool_fn
+from .tool_inputs import NoArgsInput
 from .run_langgraph_wrapper import RunLanggraphContextWrapper
+from .schedule_state import SCHEDULE_MANAGER
 
 # Setup logging for this module
 logger = logging.getLogger(__name__)
 
+# Tools that only read the schedule and may safely run concurrently
+READ_ONLY_TOOLS = frozenset(
+    {
+        "show_schedule_overview",
+        "show_load_distribution",
+        "show_violations",
+        "show_unassigned",
+        "show_snapshot",
+    }
+)
+
+# Routes requests that share the static system prompt to the same prompt cache
+PROMPT_CACHE_KEY = "univ_sched_v1"
+
+SYSTEM_INSTRUCTIONS = """You are a scheduling assistant for teacher-course assignment and timetabling.
+
+Use the provided tools to answer questions about the university schedule. Choose the most appropriate tool for each request to avoid redundancy.
+The current schedule is not included here; call show_schedule_overview when you need the current state.
+
+Available tools:
+- show_schedule_overview: Get a complete overview including teachers, workloads, sections, and assignments
+- show_load_distribution: Get a histogram and raw teacher load numbers
+- show_violations: Check for overload or conflict violations
+- rebalance: Perform automatic rebalancing of teaching assignments
+- swap: Swap a section assignment between teachers
+- show_unassigned: Find unassigned sections
+- show_snapshot: Get the overview, load distribution and unassigned sections together
+- assign_section: Assign a section to a teacher
+
+CRITICAL RULES FOR ASSIGNMENT REQUESTS:
+- BEFORE attempting to assign a section, ALWAYS call show_unassigned() to verify the section is actually unassigned
+- If a user requests to assign a section, first check if it's in the unassigned list
+- If the section is not unassigned, explain why you cannot assign it
+- Only call assign_section() after confirming the section is unassigned
+
+Guidelines:
+- For "schedule overview" or "teacher workloads", use show_schedule_overview
+- For "load distribution" or "histogram", use show_load_distribution
+- When you need more than one of overview, load distribution and unassigned sections, use show_snapshot
+- Don't call multiple tools for the same information
+- Keep responses concise and well-formatted
+
+Always be helpful and provide clear explanations of any scheduling operations performed."""
+
+
+# Tool calls (OR-Tools solves, schedule scans) run here, off the event loop and
+# without competing with other users of the loop's default executor. Only the
+# read-only tools run concurrently; the rest take SCHEDULE_MANAGER.lock.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="tool")
+
+
+async def _run_in_tool_pool(func, /, *args):
+    """Like ``asyncio.to_thread``, but on the dedicated tool pool."""
+    ctx = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_TOOL_POOL, functools.partial(ctx.run, func, *args))
+
+
+@functools.lru_cache(maxsize=1)
+def _http_async_client():
+    """Shared pooled HTTP client for async LLM calls.
+
+    Keeps connections alive between the LLM -> tool -> LLM steps of a turn.
+    HTTP/2 is used when the optional ``h2`` package is installed.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+        timeout=60,
+    )
+
 
 class AgentState(TypedDict):
     """State for the university schedule management agent graph."""
@@ -40,9 +128,22 @@ class StreamingLangGraphUniversityAgent:
     def __init__(self):
         if not LANGGRAPH_AVAILABLE:
             raise ImportError("LangGraph dependencies not available")
+        # Imported here so importing this module does not load the OpenAI client
+        # stack or build the LangChain tool objects
+        from langchain_openai import ChatOpenAI
+
+        from .langgraph_tools import UNIVERSITY_TOOLS
 
         self.tools = UNIVERSITY_TOOLS
         self.tool_node = ToolNode(self.tools)
+        # Fallback for tools without a registered python function. Registered
+        # tools are always called directly (their LangChain wrapper wraps the
+        # same callable), so they are left out and never go through .invoke
+        self._tool_by_name = {
+            name: t
+            for t in self.tools
+            if (name := getattr(t, "name", None)) and get_lg_tool_fn(name) is None
+        }
 
         # Initialize LLM with config from environment
         llm_config = get_llm_config()
@@ -52,15 +153,130 @@ class StreamingLangGraphUniversityAgent:
             openai_api_base=llm_config["openai_api_base"],
             temperature=0.1,
             streaming=True,
+            http_async_client=_http_async_client(),
+        )
+
+        # Bind tools to the LLM. The cache key goes in the request body rather
+        # than as a create() keyword, which older openai SDKs reject.
+        self.llm = base_llm.bind_tools(self.tools, tool_choice="auto").bind(
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEY}
         )
 
-        # Bind tools to the LLM
-        self.llm = base_llm.bind_tools(self.tools, tool_choice="auto")
+        # The instructions are static, so one message object serves every turn
+        self._system_message = SystemMessage(content=self._get_system_instructions())
 
         self.graph = self._build_graph()
 
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow."""
+    async def _call_model(self, state: AgentState):
+        """Call the LLM with the current state."""
+        # Add system message with instructions
+        messages = [self._system_message, *state["messages"]]
+
+        # Invoke the LLM; tokens are surfaced to stream_response as stream events
+        response = await self.llm.ainvoke(messages)
+
+        return {"messages": [response]}
+
+    def _run_tool_call(self, tool_call: dict, thread_id: str) -> ToolMessage:
+        """Execute a single tool call and wrap its result in a ToolMessage."""
+        tool_name = tool_call["name"]
+        tool_args = tool_call.get("args", {})
+        tool_call_id = tool_call.get("id")
+
+        # Log tool call
+        logger.info("Tool call [thread_id: %s]: %s with args: %s", thread_id, tool_name, tool_args)
+
+        # Prefer calling the registered python function directly (if present)
+        registered_fn = get_lg_tool_fn(tool_name)
+        tool_func = None if registered_fn else self._tool_by_name.get(tool_name)
+        if registered_fn is None and tool_func is None:
+            error_msg = f"Error: Unknown tool '{tool_name}'"
+            logger.error("Tool error [thread_id: %s]: %s", thread_id, error_msg)
+            return ToolMessage(content=error_msg, tool_call_id=tool_call_id)
+
+        try:
+            if registered_fn:
+                ctx = RunLanggraphContextWrapper.from_thread_id(thread_id)
+                # Call the underlying function with context and args
+                result = registered_fn(ctx, **tool_args)
+            elif not tool_args and getattr(tool_func, "args_schema", None) is NoArgsInput:
+                # Nothing to validate: skip the Runnable/pydantic layer
+                result = tool_func.func()
+            else:
+                # Fallback: call LangChain-wrapped tool (existing behavior)
+                result = tool_func.invoke(tool_args)
+            content = json_utils.dumps(result)
+            # Full payloads (e.g. the whole overview) are only logged at DEBUG
+            logger.info(
+                "Tool result [thread_id: %s]: %s returned %d bytes",
+                thread_id,
+                tool_name,
+                len(content),
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tool result [thread_id: %s]: %s: %s", thread_id, tool_name, content)
+            # The raw result rides along as the artifact so the stream loop
+            # does not have to parse the JSON sent to the model
+            return ToolMessage(content=content, artifact=result, tool_call_id=tool_call_id)
+        except Exception as e:
+            error_msg = f"Error: {str(e)}"
+            logger.error(
+                "Tool error [thread_id: %s]: %s failed: %s", thread_id, tool_name, error_msg
+            )
+            return ToolMessage(content=error_msg, tool_call_id=tool_call_id)
+
+    def _run_mutating_tool_call(self, tool_call: dict, thread_id: str) -> ToolMessage:
+        """Run a schedule-changing tool while holding the schedule lock.
+
+        Other chats share the tool pool, so without the lock their tools could
+        change SCHEDULE_MANAGER at the same time.
+        """
+        with SCHEDULE_MANAGER.lock:
+            return self._run_tool_call(tool_call, thread_id)
+
+    async def _call_tools(self, state: AgentState):
+        """Execute tool calls.
+
+        Consecutive read-only tools run concurrently in worker threads.
+        Tools that change the schedule run one at a time, in the order the
+        model requested them, under the schedule lock, so their effects stay
+        sequential across chats as well.
+        """
+        last_message = state["messages"][-1]
+        tool_responses: list[ToolMessage] = []
+        thread_id = state["thread_id"]
+        pending: list[dict] = []
+        run_tool_call = self._run_tool_call
+
+        async def flush_pending() -> None:
+            if pending:
+                tool_responses.extend(
+                    await asyncio.gather(
+                        *(_run_in_tool_pool(run_tool_call, tc, thread_id) for tc in pending)
+                    )
+                )
+                pending.clear()
+
+        for tool_call in last_message.tool_calls:
+            if tool_call["name"] in READ_ONLY_TOOLS:
+                pending.append(tool_call)
+                continue
+            await flush_pending()
+            tool_responses.append(
+                await _run_in_tool_pool(self._run_mutating_tool_call, tool_call, thread_id)
+            )
+        await flush_pending()
+
+        return {"messages": tool_responses}
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _build_graph(cls) -> StateGraph:
+        """Build and compile the LangGraph workflow, once per process.
+
+        The topology is static, so every agent shares the compiled graph.
+        Nodes reach the running agent through ``config["configurable"]["agent"]``.
+        """
 
         def should_continue(state: AgentState) -> str:
             """Decide whether to continue or end the conversation."""
@@ -70,82 +286,13 @@ class StreamingLangGraphUniversityAgent:
                 return "tools"
             return "end"
 
-        def call_model(state: AgentState):
+        async def call_model(state: AgentState, config: RunnableConfig):
             """Call the LLM with the current state."""
-            # Add system message with instructions
-            system_message = SystemMessage(content=self._get_system_instructions())
-            messages = [system_message] + state["messages"]
-
-            # Invoke the LLM
-            response = self.llm.invoke(messages)
-
-            return {"messages": [response]}
-
-        def call_tools(state: AgentState):
-            """Execute tool calls."""
-            last_message = state["messages"][-1]
-            tool_responses = []
-            thread_id = state["thread_id"]
-
-            for tool_call in last_message.tool_calls:
-                # Find and execute the tool
-                tool_name = tool_call["name"]
-                tool_args = tool_call.get("args", {})
-
-                # Log tool call
-                logger.info(
-                    f"Tool call [thread_id: {thread_id}]: {tool_name} with args: {tool_args}"
-                )
-
-                # Prefer calling the registered python function directly (if present)
-                registered_fn = get_lg_tool_fn(tool_name)
-                if registered_fn:
-                    try:
-                        ctx = RunLanggraphContextWrapper.from_thread_id(thread_id)
-                        # Call the underlying function with context and args
-                        result = registered_fn(ctx, **tool_args)
-                        logger.info(
-                            f"Tool result [thread_id: {thread_id}]: {tool_name} returned: {result}"
-                        )
-                        tool_responses.append(
-                            ToolMessage(
-                                content=json.dumps(result), tool_call_id=tool_call.get("id")
-                            )
-                        )
-                    except Exception as e:
-                        error_msg = f"Error: {str(e)}"
-                        logger.error(
-                            f"Tool error [thread_id: {thread_id}]: {tool_name} failed: {error_msg}"
-                        )
-                        tool_responses.append(
-                            ToolMessage(content=error_msg, tool_call_id=tool_call.get("id"))
-                        )
-                    continue
+            return await config["configurable"]["agent"]._call_model(state)
 
-                # Fallback: call LangChain-wrapped tool (existing behavior)
-                for tool_func in self.tools:
-                    if getattr(tool_func, "name", None) == tool_name:
-                        try:
-                            result = tool_func.invoke(tool_args)
-                            logger.info(
-                                f"Tool result [thread_id: {thread_id}]: {tool_name} returned: {result}"
-                            )
-                            tool_responses.append(
-                                ToolMessage(
-                                    content=json.dumps(result), tool_call_id=tool_call.get("id")
-                                )
-                            )
-                        except Exception as e:
-                            error_msg = f"Error: {str(e)}"
-                            logger.error(
-                                f"Tool error [thread_id: {thread_id}]: {tool_name} failed: {error_msg}"
-                            )
-                            tool_responses.append(
-                                ToolMessage(content=error_msg, tool_call_id=tool_call.get("id"))
-                            )
-                        break
-
-            return {"messages": tool_responses}
+        async def call_tools(state: AgentState, config: RunnableConfig):
+            """Execute the tool calls requested by the last LLM message."""
+            return await config["configurable"]["agent"]._call_tools(state)
 
         # Build the graph
         workflow = StateGraph(AgentState)
@@ -168,55 +315,29 @@ class StreamingLangGraphUniversityAgent:
         return workflow.compile()
 
     def _get_system_instructions(self) -> str:
-        """Get system instructions for the agent."""
-        # Get current schedule context
-        schedule_context = format_schedule_context()
-
-        return f"""You are a scheduling assistant for teacher-course assignment and timetabling.
+        """Get system instructions for the agent.
 
-{schedule_context}
-
-Use the provided tools to answer questions about the university schedule. Choose the most appropriate tool for each request to avoid redundancy.
-
-Available tools:
-- show_schedule_overview: Get a complete overview including teachers, workloads, sections, and assignments
-- show_load_distribution: Get a histogram and raw teacher load numbers
-- show_violations: Check for overload or conflict violations
-- rebalance: Perform automatic rebalancing of teaching assignments
-- swap: Swap a section assignment between teachers
-- show_unassigned: Find unassigned sections
-- assign_section: Assign a section to a teacher
-
-CRITICAL RULES FOR ASSIGNMENT REQUESTS:
-- BEFORE attempting to assign a section, ALWAYS call show_unassigned() to verify the section is actually unassigned
-- If a user requests to assign a section, first check if it's in the unassigned list
-- If the section is not unassigned, explain why you cannot assign it
-- Only call assign_section() after confirming the section is unassigned
-
-Guidelines:
-- For "schedule overview" or "teacher workloads", use show_schedule_overview
-- For "load distribution" or "histogram", use show_load_distribution
-- Don't call multiple tools for the same information
-- Keep responses concise and well-formatted
-
-Always be helpful and provide clear explanations of any scheduling operations performed."""
+        The prompt is fully static so the provider's prompt cache survives
+        schedule edits; the model fetches the schedule through tools instead.
+        """
+        return SYSTEM_INSTRUCTIONS
 
     async def stream_response(self, thread_id: str, messages: list[dict]) -> AsyncIterator[dict]:
         """Generate a streaming response using the LangGraph agent."""
         try:
             # Log incoming user request
-            user_messages = [msg for msg in messages if msg["role"] == "user"]
-            if user_messages:
-                latest_user_message = user_messages[-1]["content"]
-                logger.info(f"User request [thread_id: {thread_id}]: {latest_user_message}")
+            latest_user_message = next(
+                (msg["content"] for msg in reversed(messages) if msg["role"] == "user"), None
+            )
+            if latest_user_message is not None:
+                logger.info("User request [thread_id: %s]: %s", thread_id, latest_user_message)
 
             # Convert message dicts to LangChain message objects
-            langchain_messages = []
-            for msg in messages:
-                if msg["role"] == "user":
-                    langchain_messages.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "assistant":
-                    langchain_messages.append(AIMessage(content=msg["content"]))
+            langchain_messages = [
+                _ROLE_CTOR[msg["role"]](content=msg["content"])
+                for msg in messages
+                if msg["role"] in _ROLE_CTOR
+            ]
 
             # Create initial state
             state = AgentState(messages=langchain_messages, thread_id=thread_id)
@@ -224,52 +345,62 @@ Always be helpful and provide clear explanations of any scheduling operations pe
             # Track tool calls to correlate with results
             tool_call_map = {}
 
-            # Stream through the graph execution
-            async for step in self.graph.astream(state):
-                step_name = list(step.keys())[0]
-                step_data = step[step_name]
-
-                if step_name == "agent":
-                    # LLM is thinking/responding
-                    messages = step_data.get("messages", [])
+            # Stream token deltas and node completions from the graph execution
+            async for event in self.graph.astream_events(
+                state, config={"configurable": {"agent": self}}, version="v2"
+            ):
+                kind = event["event"]
+
+                if kind == "on_chat_model_stream":
+                    # LLM text as it is generated
+                    content = event["data"]["chunk"].content
+                    if content and isinstance(content, str):
+                        yield {"type": "text", "content": content}
+
+                elif kind == "on_chain_end" and event["name"] == "agent":
+                    # LLM step finished; announce any tool calls it requested
+                    messages = (event["data"].get("output") or {}).get("messages", [])
                     if messages:
                         last_message = messages[-1]
-                        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-                            # Tool calls are about to be made
-                            for tool_call in last_message.tool_calls:
-                                tool_call_id = tool_call.get("id")
-                                tool_name = tool_call["name"]
-                                # Store the mapping for later correlation
-                                if tool_call_id:
-                                    tool_call_map[tool_call_id] = tool_name
-                                yield {
-                                    "type": "tool_call_start",
-                                    "tool_name": tool_name,
-                                    "tool_args": tool_call.get("args", {}),
-                                }
-                        elif hasattr(last_message, "content") and last_message.content:
-                            # Regular text response - send as single chunk to avoid text replacement issues
-                            content = last_message.content
-                            yield {"type": "text", "content": content}
-
-                elif step_name == "tools":
-                    # Tools are being executed
-                    messages = step_data.get("messages", [])
+                        for tool_call in getattr(last_message, "tool_calls", None) or []:
+                            tool_call_id = tool_call.get("id")
+                            tool_name = tool_call["name"]
+                            # Store the mapping for later correlation
+                            if tool_call_id:
+                                tool_call_map[tool_call_id] = tool_name
+                            yield {
+                                "type": "tool_call_start",
+                                "tool_name": tool_name,
+                                "tool_args": tool_call.get("args", {}),
+                            }
+
+                elif kind == "on_chain_end" and event["name"] == "tools":
+                    # Tools finished executing
+                    messages = (event["data"].get("output") or {}).get("messages", [])
                     for message in messages:
                         if hasattr(message, "content") and hasattr(message, "tool_call_id"):
                             # Get the tool name from our mapping
                             tool_call_id = message.tool_call_id
                             tool_name = tool_call_map.get(tool_call_id, "unknown")
 
+                            result = getattr(message, "artifact", None)
+                            if result is not None:
+                                yield {
+                                    "type": "tool_result",
+                                    "tool_name": tool_name,
+                                    "result": result,
+                                }
+                                continue
+
                             try:
                                 # Try to parse tool result as JSON
-                                result = json.loads(message.content)
+                                result = json_utils.loads(message.content)
                                 yield {
                                     "type": "tool_result",
                                     "tool_name": tool_name,
                                     "result": result,
                                 }
-                            except json.JSONDecodeError:
+                            except json_utils.JSONDecodeError:
                                 # Plain text tool result
                                 yield {
                                     "type": "tool_result",
@@ -278,7 +409,7 @@ Always be helpful and provide clear explanations of any scheduling operations pe
                                 }
 
         except Exception as e:
-            logger.error(f"Streaming error [thread_id: {thread_id}]: {str(e)}")
+            logger.error("Streaming error [thread_id: %s]: %s", thread_id, e)
             yield {
                 "type": "error",
                 "content": f"I encountered an error: {str(e)}. Please try rephrasing your request.",
@@ -304,5 +435,7 @@ def create_langgraph_agent():
     return StreamingLangGraphUniversityAgent()
 
 
-# Export the agent instance
-langgraph_agent = StreamingLangGraphUniversityAgent()
+@functools.cache
+def get_agent() -> StreamingLangGraphUniversityAgent:
+    """Return the shared agent, building it (LLM client and graph) on first use."""
+    return StreamingLangGraphUniversityAgent()
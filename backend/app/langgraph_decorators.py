@@ -7,9 +7,38 @@ for LangChain/LangGraph integration.
 
 from __future__ import annotations
 
+import functools
+import sys
 from typing import Callable, Optional
 
-_LG_TOOL_REGISTRY: dict[str, dict] = {}
+# Tool name -> underlying python function (the agent's hot lookup)
+_LG_TOOL_REGISTRY: dict[str, Callable] = {}
+# Tool name -> description, only needed for listing
+_LG_TOOL_DESCRIPTIONS: dict[str, Optional[str]] = {}
+
+
+def _register(fn: Callable, name: Optional[str], description: Optional[str]) -> str:
+    # Explicit names may be built at runtime; intern them like identifiers
+    tool_name = sys.intern(name or fn.__name__)
+    if _LG_TOOL_REGISTRY.get(tool_name) is fn and _LG_TOOL_DESCRIPTIONS[tool_name] == description:
+        # Re-applying the decorator to the same function is a no-op
+        return tool_name
+    _LG_TOOL_REGISTRY[tool_name] = fn
+    _LG_TOOL_DESCRIPTIONS[tool_name] = description
+    # attach metadata to the function for convenience
+    setattr(fn, "_lg_tool_name", tool_name)
+    setattr(fn, "_lg_description", description)
+    return tool_name
+
+
+@functools.lru_cache(maxsize=1)
+def _lc_tool_decorator() -> Optional[Callable]:
+    """Resolve LangChain's ``@tool`` once; None when langchain is not installed."""
+    try:
+        from langchain_core.tools import tool
+    except ImportError:
+        return None
+    return tool
 
 
 def lg_tool(name: Optional[str] = None, description: Optional[str] = None):
@@ -22,26 +51,18 @@ def lg_tool(name: Optional[str] = None, description: Optional[str] = None):
     """
 
     def decorator(fn: Callable):
-        tool_name = name or fn.__name__
-        _LG_TOOL_REGISTRY[tool_name] = {
-            "fn": fn,
-            "description": description,
-        }
-        # attach metadata to the function for convenience
-        setattr(fn, "_lg_tool_name", tool_name)
-        setattr(fn, "_lg_description", description)
+        _register(fn, name, description)
         return fn
 
     return decorator
 
 
 def get_lg_tool_fn(name: str) -> Optional[Callable]:
-    entry = _LG_TOOL_REGISTRY.get(name)
-    return entry["fn"] if entry else None
+    return _LG_TOOL_REGISTRY.get(name)
 
 
 def list_lg_tools() -> dict:
-    return {k: {"description": v.get("description")} for k, v in _LG_TOOL_REGISTRY.items()}
+    return {k: {"description": v} for k, v in _LG_TOOL_DESCRIPTIONS.items()}
 
 
 def lg_function_tool(
@@ -62,21 +83,19 @@ def lg_function_tool(
 
     def decorator(fn: Callable):
         # Register function first so the registry stores the original callable
-        tool_name = name or fn.__name__
-        _LG_TOOL_REGISTRY[tool_name] = {"fn": fn, "description": description}
-        setattr(fn, "_lg_tool_name", tool_name)
-        setattr(fn, "_lg_description", description)
+        _register(fn, name, description)
 
-        # Try to also wrap with LangChain's @tool if available. Import lazily
-        # so this module remains importable in environments without langchain.
+        # Also wrap with LangChain's @tool if available, so this module
+        # remains importable in environments without langchain.
+        lc_tool = _lc_tool_decorator()
+        if lc_tool is None:
+            return fn
         try:
-            from langchain_core.tools import tool as _lc_tool
-
             if args_schema is not None:
-                return _lc_tool(args_schema=args_schema)(fn)
-            return _lc_tool()(fn)
+                return lc_tool(args_schema=args_schema)(fn)
+            return lc_tool()(fn)
         except Exception:
-            # langchain not available — return the registered function
+            # langchain could not wrap it — return the registered function
             return fn
 
     return decorator
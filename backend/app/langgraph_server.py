@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
+import io
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator
-import json
 
 from chatkit.types import (
     Attachment,
@@ -17,29 +18,37 @@ from chatkit.types import (
 )
 from fastapi import Depends, FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
 from openai.types.responses import ResponseInputContentParam
 
 from .config import settings
-from starlette.responses import JSONResponse
 from chatkit.server import ChatKitServer, StreamingResult
 
 from .schedule_state import SCHEDULE_MANAGER
+from . import json_utils
 from .postgres_store import PostgreSQLStore
+from .responses import FastJSONResponse
 from .database import SessionLocal, init_db
-from .langgraph_agent import langgraph_agent
+from .langgraph_agent import get_agent
 from .routers import schedule_router
 
 DEFAULT_THREAD_ID = "demo_default_thread"
 
+# Stream events are built from trusted internal data, so skip pydantic validation
+_text_delta = functools.partial(
+    AssistantMessageContentPartTextDelta.model_construct, content_index=0
+)
+_progress_update = ProgressUpdateEvent.model_construct
+
 
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
+    content = item.content
+    if len(content) == 1:
+        # Typical single-part message: no intermediate list or join
+        return (getattr(content[0], "text", None) or "").strip()
+    return " ".join(text for part in content if (text := getattr(part, "text", None))).strip()
 
 
 def _is_tool_completion_item(item: Any) -> bool:
@@ -60,9 +69,9 @@ class LangGraphChatKitAdapter:
         messages = [{"role": "user", "content": user_message}]
 
         # Accumulate the full response for final message persistence
-        full_response_parts = []
+        full_response = io.StringIO()
 
-        async for chunk in langgraph_agent.stream_response(thread_id, messages):
+        async for chunk in get_agent().stream_response(thread_id, messages):
             chunk_type = chunk.get("type")
 
             if chunk_type == "text":
@@ -70,14 +79,14 @@ class LangGraphChatKitAdapter:
                 content = chunk.get("content", "")
                 if content:
                     # Store for final message
-                    full_response_parts.append(content)
+                    full_response.write(content)
                     # Stream the delta
-                    yield AssistantMessageContentPartTextDelta(content_index=0, delta=content)
+                    yield _text_delta(delta=content)
 
             elif chunk_type == "tool_call_start":
                 # Tool call starting
                 tool_name = chunk.get("tool_name", "")
-                yield ProgressUpdateEvent(text=f"🔧 Using tool: {tool_name}...", icon="bolt")
+                yield _progress_update(text=f"🔧 Using tool: {tool_name}...", icon="bolt")
 
             elif chunk_type == "tool_result":
                 # Tool execution completed
@@ -93,14 +102,11 @@ class LangGraphChatKitAdapter:
                         if tool_name == "show_schedule_overview":
                             teachers = result.get("teachers", {})
                             if teachers:
-                                teacher_summary = []
-                                for tid, data in teachers.items():
-                                    teacher_summary.append(
-                                        f"  • {data['name']}: {data['current_load']:.1f}h / {data['max_load']}h ({data['utilization']})"
-                                    )
-                                result_text += (
-                                    "\n\nTeacher Workloads:\n" + "\n".join(teacher_summary) + "\n"
+                                teacher_summary = "\n".join(
+                                    f"  • {data['name']}: {data['current_load']:.1f}h / {data['max_load']}h ({data['utilization']})"
+                                    for data in teachers.values()
                                 )
+                                result_text += f"\n\nTeacher Workloads:\n{teacher_summary}\n"
                         elif tool_name == "assign_section":
                             if "result" in result and result.get("success"):
                                 res = result["result"]
@@ -123,28 +129,29 @@ class LangGraphChatKitAdapter:
                             clean_result = {
                                 k: v for k, v in result.items() if k not in ["histogram_path"]
                             }
-                            result_text = json.dumps(clean_result, indent=2)
+                            result_text = json_utils.dumps(clean_result, indent=True)
                 else:
                     result_text = str(result)
 
                 # Add to full response
-                full_response_parts.append(f"\n\n{result_text}")
+                full_response.write("\n\n")
+                full_response.write(result_text)
 
                 # Send tool result as progress update
-                yield ProgressUpdateEvent(text=f"✅ {tool_name}: {result_text}", icon="sparkle")
+                yield _progress_update(text=f"✅ {tool_name}: {result_text}", icon="sparkle")
 
             elif chunk_type == "error":
                 # Handle errors
                 error_msg = chunk.get("content", "Unknown error")
-                full_response_parts.append(f"\n\n❌ Error: {error_msg}")
-                yield ProgressUpdateEvent(text=f"❌ Error: {error_msg}", icon="circle-question")
+                full_response.write(f"\n\n❌ Error: {error_msg}")
+                yield _progress_update(text=f"❌ Error: {error_msg}", icon="circle-question")
 
         # Create a final persistent message with the complete response
-        if full_response_parts:
+        if full_response.tell():
             import uuid
             from datetime import datetime
 
-            complete_response = "".join(full_response_parts).strip()
+            complete_response = full_response.getvalue().strip()
 
             # Create the assistant message item for persistence
             assistant_item = AssistantMessageItem(
@@ -208,7 +215,12 @@ async def lifespan(app: FastAPI):
     pass
 
 
-app = FastAPI(title="LangGraph Academic Scheduling API", debug=settings.DEBUG, lifespan=lifespan)
+app = FastAPI(
+    title="LangGraph Academic Scheduling API",
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -219,6 +231,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies such as /schedule/state; event streams are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers with proper Pydantic response models
 app.include_router(schedule_router)
 
@@ -232,12 +247,22 @@ async def chatkit_endpoint(
     request: Request, server: LangGraphSchedulingServer = Depends(get_server)
 ) -> Response:
     payload = await request.body()
-    result = await server.process(payload, {"request": request})
+    # One session per request; the shared store picks it up from the context
+    db = SessionLocal()
+    try:
+        result = await server.process(payload, {"request": request, "db": db})
+    except BaseException:
+        db.close()
+        raise
     if isinstance(result, StreamingResult):
-        return StreamingResponse(result, media_type="text/event-stream")
+        # The stream keeps using the session, so close it once the body is sent
+        return StreamingResponse(
+            result, media_type="text/event-stream", background=BackgroundTask(db.close)
+        )
+    db.close()
     if hasattr(result, "json"):
         return Response(content=result.json, media_type="application/json")
-    return JSONResponse(result)
+    return FastJSONResponse(result)
 
 
 def _thread_param(thread_id: str | None) -> str:
@@ -7,6 +7,8 @@ for type safety and validation. Thread context is managed via LangGraphContext.
 
 from __future__ import annotations
 
+import os
+
 try:
     from langchain_core.tools import tool  # noqa: F401
 
@@ -26,20 +28,16 @@ from .core_tools import (
 )
 from .tool_inputs import (
     AssignSectionInput,
+    NoArgsInput,
     RebalanceInput,
-    ResetScheduleInput,
-    ShowLoadDistributionInput,
-    ShowScheduleOverviewInput,
-    ShowUnassignedInput,
     ShowViolationsInput,
     SwapInput,
 )
 from .langgraph_decorators import lg_function_tool
 from .run_langgraph_wrapper import RunLanggraphContextWrapper
-from typing import TYPE_CHECKING
+from typing import Callable
 
-if TYPE_CHECKING:
-    from chatkit.agents import AgentContext
+from chatkit.agents import AgentContext
 from .tool_responses import (
     AssignmentResponse,
     LoadDistributionResponse,
@@ -47,52 +45,98 @@ from .tool_responses import (
     ResetScheduleResponse,
     ScheduleOverviewResponse,
     SwapResponse,
-    TeacherLoadInfo,
     UnassignedResponse,
     ViolationsResponse,
 )
 
+# tool name -> (core result, dumped response) for the read-only tools
+_dump_cache: dict[str, tuple[dict, dict]] = {}
+
+
+def _cached_dump(tool_name: str, result: dict, dump: Callable[[dict], dict]) -> dict:
+    """Return ``dump(result)``, reusing the previous dump of the same result object.
+
+    The core_* functions are memoized per schedule version, so the same object
+    comes back until the schedule changes. Entries are keyed on that object's
+    identity and are never evicted; the first call after a version bump gets
+    a new core result and replaces the tool's entry. The cached dicts are
+    shared between calls and must be treated as read-only.
+    """
+    cached = _dump_cache.get(tool_name)
+    if cached is not None and cached[0] is result:
+        return cached[1]
+    value = dump(result)
+    _dump_cache[tool_name] = (result, value)
+    return value
+
+
+def _trust_core_results() -> bool:
+    """Whether read-only tools may skip response validation (TRUST_CORE_TOOLS, default off).
+
+    The core_* functions build these results from the in-memory schedule, so
+    the pydantic round trip only re-checks data we produced ourselves.
+    """
+    return os.getenv("TRUST_CORE_TOOLS", "0") == "1"
+
+
+def _dump_schedule_overview(result: dict) -> dict:
+    if _trust_core_results():
+        # Skip validation; the dump still converts datetimes/enums to JSON types
+        response = ScheduleOverviewResponse.model_construct(**result)
+        return response.model_dump(mode="json", warnings=False)
+    # One validation pass over the whole result, nested teachers included
+    response = ScheduleOverviewResponse.model_validate(result)
+    # Return as dict for JSON serialization
+    return response.model_dump(mode="json")
+
+
+def _dump_load_distribution(result: dict) -> dict:
+    if _trust_core_results() and "error" not in result:
+        return {"histogram_path": None, "histogram": None, "statistics": None, **result}
+    response = LoadDistributionResponse.model_validate(result)
+    return response.model_dump(mode="json")
+
+
+def _dump_unassigned(result: dict) -> dict:
+    if _trust_core_results():
+        return {**result, "count": len(result["unassigned_sections"])}
+    response = UnassignedResponse.model_validate(result)
+    return response.model_dump(mode="json")
+
 
 @lg_function_tool(
-    args_schema=ShowScheduleOverviewInput,
+    args_schema=NoArgsInput,
     description="Get an overview of the current schedule state including all teachers, sections, and assignments.",
 )
-def show_schedule_overview(ctx: RunLanggraphContextWrapper["AgentContext"]) -> dict:
+def show_schedule_overview(ctx: RunLanggraphContextWrapper[AgentContext]) -> dict:
     """Get an overview of the current schedule state including all teachers, sections, and assignments."""
-    result = core_show_schedule_overview()
-    # Return as dict for JSON serialization
-    response = ScheduleOverviewResponse(
-        message=result["message"],
-        teachers={tid: TeacherLoadInfo(**td) for tid, td in result["teachers"].items()},
-        sections=result["sections"],
-        assignments=result["assignments"],
-        rooms=result["rooms"],
+    return _cached_dump(
+        "show_schedule_overview", core_show_schedule_overview(), _dump_schedule_overview
     )
-    return response.model_dump(mode="json")
 
 
 @lg_function_tool(
-    args_schema=ShowLoadDistributionInput,
+    args_schema=NoArgsInput,
     description="Compute the teaching load per teacher and return a histogram image path + raw loads.",
 )
-def show_load_distribution(ctx: RunLanggraphContextWrapper["AgentContext"]) -> dict:
+def show_load_distribution(ctx: RunLanggraphContextWrapper[AgentContext]) -> dict:
     """Compute the teaching load per teacher and return a histogram image path + raw loads."""
-    result = core_show_load_distribution()
-    response = LoadDistributionResponse(**result)
-    return response.model_dump(mode="json")
+    return _cached_dump(
+        "show_load_distribution", core_show_load_distribution(), _dump_load_distribution
+    )
 
 
 @lg_function_tool(
     args_schema=ShowViolationsInput,
     description="Show violations of a given type: overload or conflict.",
 )
-def show_violations(ctx: RunLanggraphContextWrapper["AgentContext"], type: str = "") -> dict:
+def show_violations(ctx: RunLanggraphContextWrapper[AgentContext], type: str = "") -> dict:
     """Show violations of a given type: overload or conflict."""
     result = core_show_violations(type)
     if "error" in result:
         response = ViolationsResponse(type=type, violations=[])
     else:
-        response = ViolationsResponse(**result)
+        response = ViolationsResponse.model_validate(result)
     return response.model_dump(mode="json")
 
 
@@ -100,12 +144,9 @@ def show_violations(ctx: RunLanggraphContextWrapper["AgentContext"], type: str =
     args_schema=RebalanceInput,
     description="Run optimal rebalancing using OR-Tools to minimize load variance.",
 )
-def rebalance(
-    ctx: RunLanggraphContextWrapper["AgentContext"], max_load_hours: float = None
-) -> dict:
+def rebalance(ctx: RunLanggraphContextWrapper[AgentContext], max_load_hours: float = None) -> dict:
     """Run optimal rebalancing using OR-Tools to minimize load variance."""
-    result = core_rebalance(max_load_hours)
-    response = RebalancingResponse(**result)
+    response = RebalancingResponse.model_validate(core_rebalance(max_load_hours))
     return response.model_dump(mode="json")
 
 
@@ -113,7 +154,7 @@ def rebalance(
     args_schema=SwapInput, description="Swap a section from one teacher to another by names or IDs."
 )
 def swap(
-    ctx: RunLanggraphContextWrapper["AgentContext"],
+    ctx: RunLanggraphContextWrapper[AgentContext],
     section_id: str = "",
     from_teacher: str = "",
     to_teacher: str = "",
@@ -132,14 +173,31 @@ def swap(
 
 
 @lg_function_tool(
-    args_schema=ShowUnassignedInput,
+    args_schema=NoArgsInput,
     description="Find all unassigned course sections that need teacher assignments.",
 )
-def show_unassigned(ctx: RunLanggraphContextWrapper["AgentContext"]) -> dict:
+def show_unassigned(ctx: RunLanggraphContextWrapper[AgentContext]) -> dict:
     """Find all unassigned course sections that need teacher assignments."""
-    result = core_show_unassigned()
-    response = UnassignedResponse(**result)
-    return response.model_dump(mode="json")
+    return _cached_dump("show_unassigned", core_show_unassigned(), _dump_unassigned)
+
+
+@lg_function_tool(
+    args_schema=NoArgsInput,
+    description="Get the schedule overview, load distribution and unassigned sections in one call.",
+)
+def show_snapshot(ctx: RunLanggraphContextWrapper[AgentContext]) -> dict:
+    """Get the schedule overview, load distribution and unassigned sections in one call."""
+    unassigned = _cached_dump("show_unassigned", core_show_unassigned(), _dump_unassigned)
+    return {
+        "message": f"Schedule snapshot retrieved ({unassigned['count']} unassigned section(s))",
+        "overview": _cached_dump(
+            "show_schedule_overview", core_show_schedule_overview(), _dump_schedule_overview
+        ),
+        "load_distribution": _cached_dump(
+            "show_load_distribution", core_show_load_distribution(), _dump_load_distribution
+        ),
+        "unassigned": unassigned,
+    }
 
 
 @lg_function_tool(
@@ -147,7 +205,7 @@ def show_unassigned(ctx: RunLanggraphContextWrapper["AgentContext"]) -> dict:
     description="Assign an unassigned course section to a qualified teacher.",
 )
 def assign_section(
-    ctx: RunLanggraphContextWrapper["AgentContext"], section_id: str = "", teacher: str = ""
+    ctx: RunLanggraphContextWrapper[AgentContext], section_id: str = "", teacher: str = ""
 ) -> dict:
     """Assign an unassigned course section to a qualified teacher."""
     result = core_assign_section(section_id, teacher)
@@ -161,13 +219,12 @@ def assign_section(
 
 
 @lg_function_tool(
-    args_schema=ResetScheduleInput,
+    args_schema=NoArgsInput,
     description="Reset the entire schedule to its initial state with sample data.",
 )
-def reset_schedule(ctx: RunLanggraphContextWrapper["AgentContext"]) -> dict:
+def reset_schedule(ctx: RunLanggraphContextWrapper[AgentContext]) -> dict:
     """Reset the entire schedule to its initial state with sample data."""
-    result = core_reset_schedule()
-    response = ResetScheduleResponse(**result)
+    response = ResetScheduleResponse.model_validate(core_reset_schedule())
     return response.model_dump(mode="json")
 
 
@@ -179,6 +236,7 @@ UNIVERSITY_TOOLS = [
     rebalance,
     swap,
     show_unassigned,
+    show_snapshot,
     assign_section,
     reset_schedule,
 ]
@@ -8,7 +8,7 @@ from chatkit.store import NotFoundError, Store
 from chatkit.types import Attachment, Page, Thread, ThreadItem, ThreadMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class _ThreadState:
     thread: ThreadMetadata
     items: List[ThreadItem]
@@ -20,20 +20,22 @@ from .models import (
 )
 
 
-def convert_legacy_timeslot(legacy_data: dict[str, Any]) -> TimeSlot:
+def convert_legacy_timeslot(legacy_data: dict[str, Any], trusted: bool = False) -> TimeSlot:
     """Convert legacy timeslot dictionary to Pydantic TimeSlot."""
-    return TimeSlot(
+    build = TimeSlot.model_construct if trusted else TimeSlot
+    return build(
         day=WeekDay(legacy_data["day"]),
         start_hour=legacy_data["start_hour"],
         end_hour=legacy_data["end_hour"],
     )
 
 
-def convert_legacy_teacher(legacy_data: dict[str, Any]) -> Teacher:
+def convert_legacy_teacher(legacy_data: dict[str, Any], trusted: bool = False) -> Teacher:
     """Convert legacy teacher dictionary to Pydantic Teacher."""
-    availability = []
-    for slot_data in legacy_data.get("availability", []):
-        availability.append(convert_legacy_timeslot(slot_data))
+    availability = [
+        convert_legacy_timeslot(slot_data, trusted)
+        for slot_data in legacy_data.get("availability", [])
+    ]
 
     # Generate email from name if not provided (legacy data won't have email)
     email = legacy_data.get("email")
@@ -46,7 +48,8 @@ def convert_legacy_teacher(legacy_data: dict[str, Any]) -> Teacher:
             name_parts = name_parts[1:]
         email = ".".join(name_parts) + "@university.edu"
 
-    return Teacher(
+    build = Teacher.model_construct if trusted else Teacher
+    return build(
         id=legacy_data["id"],
         name=legacy_data["name"],
         email=email,
@@ -56,22 +59,25 @@ def convert_legacy_teacher(legacy_data: dict[str, Any]) -> Teacher:
     )
 
 
-def convert_legacy_room(legacy_data: dict[str, Any]) -> Room:
+def convert_legacy_room(legacy_data: dict[str, Any], trusted: bool = False) -> Room:
     """Convert legacy room dictionary to Pydantic Room."""
-    return Room(
+    build = Room.model_construct if trusted else Room
+    return build(
         id=legacy_data["id"],
         capacity=legacy_data["capacity"],
         features=set(legacy_data.get("features", [])),
     )
 
 
-def convert_legacy_section(legacy_data: dict[str, Any]) -> CourseSection:
+def convert_legacy_section(legacy_data: dict[str, Any], trusted: bool = False) -> CourseSection:
     """Convert legacy section dictionary to Pydantic CourseSection."""
-    timeslots = []
-    for slot_data in legacy_data.get("timeslots", []):
-        timeslots.append(convert_legacy_timeslot(slot_data))
+    timeslots = tuple(
+        convert_legacy_timeslot(slot_data, trusted)
+        for slot_data in legacy_data.get("timeslots", [])
+    )
 
-    return CourseSection(
+    build = CourseSection.model_construct if trusted else CourseSection
+    return build(
         id=legacy_data["id"],
         course_code=legacy_data["course_code"],
         timeslots=timeslots,
@@ -80,9 +86,10 @@ def convert_legacy_section(legacy_data: dict[str, Any]) -> CourseSection:
     )
 
 
-def convert_legacy_assignment(legacy_data: dict[str, Any]) -> Assignment:
+def convert_legacy_assignment(legacy_data: dict[str, Any], trusted: bool = False) -> Assignment:
     """Convert legacy assignment dictionary to Pydantic Assignment."""
-    return Assignment(
+    build = Assignment.model_construct if trusted else Assignment
+    return build(
         section_id=legacy_data["section_id"],
         teacher_id=legacy_data.get("teacher_id"),
         room_id=legacy_data.get("room_id"),
@@ -90,40 +97,45 @@ def convert_legacy_assignment(legacy_data: dict[str, Any]) -> Assignment:
     )
 
 
-def convert_legacy_schedule_state(legacy_data: dict[str, Any]) -> ScheduleState:
-    """Convert legacy schedule state dictionary to Pydantic ScheduleState."""
-    # Convert teachers
-    teachers = {}
-    for teacher_id, teacher_data in legacy_data.get("teachers", {}).items():
-        teachers[teacher_id] = convert_legacy_teacher(teacher_data)
-
-    # Convert rooms
-    rooms = {}
-    for room_id, room_data in legacy_data.get("rooms", {}).items():
-        rooms[room_id] = convert_legacy_room(room_data)
-
-    # Convert sections
-    sections = {}
-    for section_id, section_data in legacy_data.get("sections", {}).items():
-        sections[section_id] = convert_legacy_section(section_data)
+def convert_legacy_schedule_state(
+    legacy_data: dict[str, Any], trusted: bool = False
+) -> ScheduleState:
+    """Convert legacy schedule state dictionary to Pydantic ScheduleState.
 
-    # Convert assignments
-    assignments = {}
-    for section_id, assignment_data in legacy_data.get("assignments", {}).items():
-        assignments[section_id] = convert_legacy_assignment(assignment_data)
+    With ``trusted=True`` the models are built with ``model_construct`` and no
+    validators run. Only use it for data that was already validated when it
+    was written, e.g. a previous ``export_to_legacy_format`` dump.
+    """
+    teachers = {
+        teacher_id: convert_legacy_teacher(teacher_data, trusted)
+        for teacher_id, teacher_data in legacy_data.get("teachers", {}).items()
+    }
+    rooms = {
+        room_id: convert_legacy_room(room_data, trusted)
+        for room_id, room_data in legacy_data.get("rooms", {}).items()
+    }
+    sections = {
+        section_id: convert_legacy_section(section_data, trusted)
+        for section_id, section_data in legacy_data.get("sections", {}).items()
+    }
+    assignments = {
+        section_id: convert_legacy_assignment(assignment_data, trusted)
+        for section_id, assignment_data in legacy_data.get("assignments", {}).items()
+    }
 
     # Convert timeline (if present)
-    timeline = []
-    for entry_data in legacy_data.get("timeline", []):
-        timeline.append(
-            TimelineEntry(
-                kind=TimelineEntryKind(entry_data.get("kind", "system")),
-                entry=entry_data["entry"],
-                # timestamp will be set to current time by default
-            )
+    build_entry = TimelineEntry.model_construct if trusted else TimelineEntry
+    timeline = [
+        build_entry(
+            kind=TimelineEntryKind(entry_data.get("kind", "system")),
+            entry=entry_data["entry"],
+            # timestamp will be set to current time by default
         )
+        for entry_data in legacy_data.get("timeline", [])
+    ]
 
-    return ScheduleState(
+    build = ScheduleState.model_construct if trusted else ScheduleState
+    return build(
         teachers=teachers,
         rooms=rooms,
         sections=sections,
@@ -132,52 +144,32 @@ def convert_legacy_schedule_state(legacy_data: dict[str, Any]) -> ScheduleState:
     )
 
 
+# Fields the legacy dataclasses never had
+_LEGACY_EXCLUDE = {
+    "teachers": {"__all__": {"email"}},
+    "assignments": {"__all__": {"assigned_at"}},
+}
+# Asks TimelineEntry for the legacy timestamp text
+_LEGACY_CONTEXT = {"legacy": True}
+
+
 def export_to_legacy_format(schedule_state: ScheduleState) -> dict[str, Any]:
-    """Export Pydantic ScheduleState to legacy dictionary format for backward compatibility."""
-    return {
-        "teachers": {
-            teacher_id: {
-                "id": teacher.id,
-                "name": teacher.name,
-                "max_load_hours": teacher.max_load_hours,
-                "qualified_courses": list(teacher.qualified_courses),
-                "availability": [
-                    {"day": slot.day, "start_hour": slot.start_hour, "end_hour": slot.end_hour}
-                    for slot in teacher.availability
-                ],
-            }
-            for teacher_id, teacher in schedule_state.teachers.items()
-        },
-        "rooms": {
-            room_id: {"id": room.id, "capacity": room.capacity, "features": list(room.features)}
-            for room_id, room in schedule_state.rooms.items()
-        },
-        "sections": {
-            section_id: {
-                "id": section.id,
-                "course_code": section.course_code,
-                "timeslots": [
-                    {"day": slot.day, "start_hour": slot.start_hour, "end_hour": slot.end_hour}
-                    for slot in section.timeslots
-                ],
-                "enrollment": section.enrollment,
-                "required_feature": section.required_feature,
-            }
-            for section_id, section in schedule_state.sections.items()
-        },
-        "assignments": {
-            section_id: {
-                "section_id": assignment.section_id,
-                "teacher_id": assignment.teacher_id,
-                "room_id": assignment.room_id,
-            }
-            for section_id, assignment in schedule_state.assignments.items()
-        },
-        "timeline": [
-            {"kind": entry.kind, "entry": entry.entry, "timestamp": entry.timestamp.isoformat()}
-            for entry in schedule_state.timeline
-        ],
-    }
+    """Export Pydantic ScheduleState to legacy dictionary format for backward compatibility.
+
+    pydantic-core does the whole walk: sets become lists and enums their
+    values. Timeline timestamps keep the legacy ``isoformat()`` text through
+    the ``legacy`` serialization context.
+    """
+    return schedule_state.model_dump(mode="json", exclude=_LEGACY_EXCLUDE, context=_LEGACY_CONTEXT)
+
+
+def export_to_legacy_json(schedule_state: ScheduleState) -> str:
+    """Export straight to legacy-format JSON text.
+
+    Same document as ``export_to_legacy_format``, but pydantic-core writes the
+    JSON directly from the models without building the intermediate dicts.
+    """
+    return schedule_state.model_dump_json(exclude=_LEGACY_EXCLUDE, context=_LEGACY_CONTEXT)
 
 
 # Example usage for testing migration
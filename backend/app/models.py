@@ -9,8 +9,20 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
-
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
+from functools import cached_property
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 
 class WeekDay(int, Enum):
@@ -25,10 +37,29 @@ class WeekDay(int, Enum):
     SUNDAY = 7
 
 
+# Display names for TimeSlot.__str__, keyed by day number
+_DAY_NAMES = {day.value: day.name.capitalize() for day in WeekDay}
+
+# Room features accepted by Room.validate_features
+_VALID_FEATURES = frozenset(
+    {
+        "projector",
+        "computers",
+        "whiteboard",
+        "smartboard",
+        "audio",
+        "video",
+        "lab_equipment",
+        "wheelchair_accessible",
+    }
+)
+
+
 class TimeSlot(BaseModel):
     """Represents a time slot for scheduling with validation."""
 
-    model_config = ConfigDict(extra="forbid")
+    # Frozen so a section's cached duration cannot go stale through a slot edit
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     day: WeekDay = Field(..., description="Day of the week (1=Monday, 7=Sunday)")
     start_hour: float = Field(
@@ -57,25 +88,26 @@ class TimeSlot(BaseModel):
 
     def __str__(self) -> str:
         """Human-readable string representation."""
-        if isinstance(self.day, WeekDay):
-            day_name = self.day.name.capitalize()
-        else:
-            # Handle case where day is stored as int
-            day_names = {
-                1: "Monday",
-                2: "Tuesday",
-                3: "Wednesday",
-                4: "Thursday",
-                5: "Friday",
-                6: "Saturday",
-                7: "Sunday",
-            }
-            day_name = day_names.get(self.day, f"Day{self.day}")
+        # WeekDay members hash like their ints, so one lookup covers both
+        day_name = _DAY_NAMES.get(self.day) or f"Day{self.day}"
         start_time = f"{int(self.start_hour):02d}:{int((self.start_hour % 1) * 60):02d}"
         end_time = f"{int(self.end_hour):02d}:{int((self.end_hour % 1) * 60):02d}"
         return f"{day_name} {start_time}-{end_time}"
 
 
+def _find_overlap(slots: list[TimeSlot]) -> tuple[TimeSlot, TimeSlot] | None:
+    """Return the first pair of overlapping slots, or None.
+
+    Sorting by (day, start) means any overlap shows up between neighbours,
+    so one sweep replaces the pairwise comparison.
+    """
+    ordered = sorted(slots, key=lambda slot: (slot.day, slot.start_hour))
+    for prev, curr in zip(ordered, ordered[1:]):
+        if prev.day == curr.day and curr.start_hour < prev.end_hour:
+            return prev, curr
+    return None
+
+
 class Teacher(BaseModel):
     """Represents a teacher with qualifications and availability."""
 
@@ -111,12 +143,9 @@ class Teacher(BaseModel):
     @classmethod
     def validate_no_overlapping_slots(cls, v: list[TimeSlot]) -> list[TimeSlot]:
         """Ensure teacher availability slots don't overlap."""
-        for i, slot1 in enumerate(v):
-            for j, slot2 in enumerate(v[i + 1 :], i + 1):
-                if slot1.day == slot2.day and not (
-                    slot1.end_hour <= slot2.start_hour or slot2.end_hour <= slot1.start_hour
-                ):
-                    raise ValueError(f"Overlapping availability slots: {slot1} and {slot2}")
+        overlap = _find_overlap(v)
+        if overlap:
+            raise ValueError(f"Overlapping availability slots: {overlap[0]} and {overlap[1]}")
         return v
 
     def compute_total_availability_hours(self) -> float:
@@ -139,20 +168,10 @@ class Room(BaseModel):
     @classmethod
     def validate_features(cls, v: set[str]) -> set[str]:
         """Ensure feature names are valid."""
-        valid_features = {
-            "projector",
-            "computers",
-            "whiteboard",
-            "smartboard",
-            "audio",
-            "video",
-            "lab_equipment",
-            "wheelchair_accessible",
-        }
         for feature in v:
-            if feature not in valid_features:
+            if feature not in _VALID_FEATURES:
                 raise ValueError(
-                    f"Unknown room feature: {feature}. Valid features: {', '.join(valid_features)}"
+                    f"Unknown room feature: {feature}. Valid features: {', '.join(_VALID_FEATURES)}"
                 )
         return v
 
@@ -166,7 +185,8 @@ class CourseSection(BaseModel):
     course_code: str = Field(
         ..., min_length=1, max_length=20, description="Course code (e.g., CS101)"
     )
-    timeslots: list[TimeSlot] = Field(
+    # A tuple, so the slots can only change by reassignment (see __setattr__)
+    timeslots: tuple[TimeSlot, ...] = Field(
         ..., min_items=1, description="Scheduled time slots for this section"
     )
     enrollment: int = Field(..., ge=0, le=1000, description="Number of enrolled students")
@@ -182,19 +202,37 @@ class CourseSection(BaseModel):
 
     @field_validator("timeslots")
     @classmethod
-    def validate_no_overlapping_timeslots(cls, v: list[TimeSlot]) -> list[TimeSlot]:
+    def validate_no_overlapping_timeslots(cls, v: tuple[TimeSlot, ...]) -> tuple[TimeSlot, ...]:
         """Ensure section timeslots don't overlap."""
-        for i, slot1 in enumerate(v):
-            for j, slot2 in enumerate(v[i + 1 :], i + 1):
-                if slot1.day == slot2.day and not (
-                    slot1.end_hour <= slot2.start_hour or slot2.end_hour <= slot1.start_hour
-                ):
-                    raise ValueError(f"Overlapping timeslots in section: {slot1} and {slot2}")
+        overlap = _find_overlap(v)
+        if overlap:
+            raise ValueError(f"Overlapping timeslots in section: {overlap[0]} and {overlap[1]}")
         return v
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "timeslots":
+            # Keep the slots immutable and drop the cached duration
+            value = tuple(value)
+            self.__dict__.pop("duration_hours", None)
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> "CourseSection":
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "timeslots" in update:
+            # The copied __dict__ carries the old cached duration; reassigning resets it
+            copied.timeslots = update["timeslots"]
+        return copied
+
+    @cached_property
+    def duration_hours(self) -> float:
+        """Total weekly hours for this section, cached until timeslots are reassigned."""
+        return sum((slot.end_hour - slot.start_hour) for slot in self.timeslots)
+
     def compute_weekly_hours(self) -> float:
         """Calculate total weekly hours for this section."""
-        return sum((slot.end_hour - slot.start_hour) for slot in self.timeslots)
+        return self.duration_hours
 
 
 class Assignment(BaseModel):
@@ -262,6 +300,15 @@ class TimelineEntry(BaseModel):
             raise ValueError("Timeline timestamp cannot be in the future")
         return v
 
+    @field_serializer("timestamp", mode="wrap")
+    def serialize_timestamp(
+        self, v: datetime, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Any:
+        """Keep ``isoformat()`` text ("+00:00", not "Z") for the legacy export."""
+        if info.context and info.context.get("legacy"):
+            return v.isoformat()
+        return handler(v)
+
 
 class ScheduleState(BaseModel):
     """Complete state of the scheduling system."""
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+
 from agents import Agent
 from chatkit.agents import AgentContext
 
 from .openai_tools import OPENAI_TOOLS
 
+# Routes requests that share the static instructions to the same prompt cache
+PROMPT_CACHE_KEY = "univ_sched_openai_v1"
+
 SCHEDULING_AGENT_INSTRUCTIONS = """
 You are an intelligent scheduling assistant for academic course timetabling and teacher assignment.
 You help administrators manage teacher workloads, resolve scheduling conflicts, and optimize
@@ -49,5 +54,7 @@ def build_scheduling_agent() -> Agent[AgentContext]:
     )
 
 
-# Export the agent instance
-scheduling_agent = build_scheduling_agent()
+@functools.cache
+def get_scheduling_agent() -> Agent[AgentContext]:
+    """Return the process-wide scheduling agent, building it on first use."""
+    return build_scheduling_agent()
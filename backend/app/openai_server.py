@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator
 
@@ -16,34 +17,52 @@ from chatkit.types import (
 )
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import Response, StreamingResponse
 from openai.types.responses import ResponseInputContentParam
-from starlette.responses import JSONResponse
+from starlette.background import BackgroundTask
 
-from .agent_utils import format_schedule_context
+from .agent_utils import format_schedule_context, format_schedule_summary
 from .config import settings
 from .database import SessionLocal, init_db
-from .openai_agent import scheduling_agent
+from .openai_agent import PROMPT_CACHE_KEY, get_scheduling_agent
 from .postgres_store import PostgreSQLStore
+from .responses import FastJSONResponse
 from .routers import schedule_router
 
 DEFAULT_THREAD_ID = "demo_default_thread"
 
-DEFAULT_THREAD_ID = "demo_default_thread"
+# Same run settings for every turn; built once instead of per request
+_RUN_CONFIG = RunConfig(
+    model_settings=ModelSettings(
+        temperature=0.4,
+        # Sent in the request body, so openai SDKs without the keyword accept it
+        extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
+    )
+)
 
 
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
+    content = item.content
+    if len(content) == 1:
+        # Typical single-part message: no intermediate list or join
+        return (getattr(content[0], "text", None) or "").strip()
+    return " ".join(text for part in content if (text := getattr(part, "text", None))).strip()
+
+
+# Requests that ask for the whole picture get every teacher's load inline
+_FULL_CONTEXT_RE = re.compile(r"\b(?:show all|overview|full schedule|all teachers)\b", re.I)
 
 
-def _format_schedule_context() -> str:
-    """Format the current schedule state as context for the agent."""
-    return format_schedule_context()
+def _format_schedule_context(message_text: str = "") -> str:
+    """Format the current schedule state as context for the agent.
+
+    Most turns only get the short summary; the agent's tools fetch details on
+    demand, so the prompt does not grow with the number of teachers.
+    """
+    if _FULL_CONTEXT_RE.search(message_text):
+        return format_schedule_context()
+    return format_schedule_summary()
 
 
 def _is_tool_completion_item(item: Any) -> bool:
@@ -55,7 +74,7 @@ class SchedulingServer(ChatKitServer[dict[str, Any]]):
         store = PostgreSQLStore(SessionLocal)
         super().__init__(store)
         self.store = store
-        self.agent = scheduling_agent
+        self.agent = get_scheduling_agent()
 
     def _resolve_thread_id(self, thread: ThreadMetadata | None) -> str:
         return thread.id if thread and thread.id else DEFAULT_THREAD_ID
@@ -76,7 +95,7 @@ class SchedulingServer(ChatKitServer[dict[str, Any]]):
         if not message_text:
             return
 
-        context_prompt = _format_schedule_context()
+        context_prompt = _format_schedule_context(message_text)
         combined_prompt = (
             f"{context_prompt}\n\nUser request: {message_text}\n"
             "Respond as the academic scheduling assistant."
@@ -91,7 +110,7 @@ class SchedulingServer(ChatKitServer[dict[str, Any]]):
             self.agent,
             combined_prompt,
             context=agent_context,
-            run_config=RunConfig(model_settings=ModelSettings(temperature=0.4)),
+            run_config=_RUN_CONFIG,
         )
 
         async for event in stream_agent_response(agent_context, result):
@@ -114,7 +133,12 @@ async def lifespan(app: FastAPI):
     pass
 
 
-app = FastAPI(title="ChatKit Academic Scheduling API", debug=settings.DEBUG, lifespan=lifespan)
+app = FastAPI(
+    title="ChatKit Academic Scheduling API",
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -123,6 +147,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies such as /schedule/state; event streams are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers with proper Pydantic response models
 app.include_router(schedule_router)
 
@@ -136,12 +163,22 @@ async def chatkit_endpoint(
     request: Request, server: SchedulingServer = Depends(get_server)
 ) -> Response:
     payload = await request.body()
-    result = await server.process(payload, {"request": request})
+    # One session per request; the shared store picks it up from the context
+    db = SessionLocal()
+    try:
+        result = await server.process(payload, {"request": request, "db": db})
+    except BaseException:
+        db.close()
+        raise
     if isinstance(result, StreamingResult):
-        return StreamingResponse(result, media_type="text/event-stream")
+        # The stream keeps using the session, so close it once the body is sent
+        return StreamingResponse(
+            result, media_type="text/event-stream", background=BackgroundTask(db.close)
+        )
+    db.close()
     if hasattr(result, "json"):
         return Response(content=result.json, media_type="application/json")
-    return JSONResponse(result)
+    return FastJSONResponse(result)
 
 
 def _thread_param(thread_id: str | None) -> str:
@@ -1,18 +1,57 @@
 """PostgreSQL-backed ChatKit Store implementation."""
 
+import asyncio
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, get_args
 
 from chatkit.store import NotFoundError, Store
-from chatkit.types import Attachment, Page, Thread, ThreadItem, ThreadMetadata, UserMessageItem, UserMessageTextContent, InferenceOptions
+from chatkit.types import Attachment, ClientToolCallItem, Page, Thread, ThreadItem, ThreadMetadata, UserMessageItem, UserMessageTextContent, InferenceOptions
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.db_models import Thread as ThreadDB
 from app.db_models import ThreadItem as ThreadItemDB
 
 
+# Dialects whose insert() supports ON CONFLICT DO UPDATE, for save_item's upsert
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Stored item_type (the class name) -> ChatKit item class, for loading rows back
+_ITEM_CLASSES: dict[str, type] = {cls.__name__: cls for cls in get_args(get_args(ThreadItem)[0])}
+# Value of the role column per item class; anything else is "assistant"
+_ITEM_ROLES: dict[type, str] = {UserMessageItem: "user", ClientToolCallItem: "tool"}
+
+# Fields copied when narrowing a Thread down to its metadata
+_THREAD_METADATA_FIELDS = tuple(ThreadMetadata.model_fields)
+
+
+def _item_role(item: ThreadItem) -> str:
+    return _ITEM_ROLES.get(type(item), "assistant")
+
+
+def _after_cursor(model: Any, cursor_filter: Any, order: str) -> Any:
+    """Filter for rows created after (asc) or before (desc) the cursor row.
+
+    The cursor's ``created_at`` is read by a scalar subquery, so each page is a
+    single statement. An unknown cursor yields NULL and leaves the page
+    unfiltered, as the old two-query version did.
+    """
+    cursor_created = select(model.created_at).where(cursor_filter).scalar_subquery()
+    if order == "desc":
+        return or_(cursor_created.is_(None), model.created_at < cursor_created)
+    return or_(cursor_created.is_(None), model.created_at > cursor_created)
+
+
 class PostgreSQLStore(Store[dict[str, Any]]):
-    """PostgreSQL-backed Store for ChatKit chat history and metadata."""
+    """PostgreSQL-backed Store for ChatKit chat history and metadata.
+
+    SQLAlchemy sessions block, so each async Store method runs its ``*_sync``
+    counterpart in a worker thread and the event loop keeps serving other
+    requests during database I/O.
+    """
 
     def __init__(self, session_factory: Callable[[], Session] | Session):
         """Initialize store with either a session factory or a session."""
@@ -22,74 +61,84 @@ class PostgreSQLStore(Store[dict[str, Any]]):
             # If a session is passed, wrap it in a callable that returns it
             session = session_factory
             self.session_factory = lambda: session
-        # Keep a cached session for the current request
-        self._current_session: Session | None = None
-
-    def _get_session(self) -> Session:
-        """Get or create a session for the current operation."""
-        if self._current_session is None:
-            self._current_session = self.session_factory()
-        return self._current_session
-
-    def _reset_session(self) -> None:
-        """Reset the cached session after operation completes."""
-        if self._current_session is not None:
-            try:
-                self._current_session.close()
-            except Exception:
-                pass
-            self._current_session = None
 
-    @property
-    def db(self) -> Session:
-        """Get the database session for current operation."""
-        return self._get_session()
+    @contextmanager
+    def _session(self, context: dict[str, Any]) -> Iterator[Session]:
+        """Yield the request's session (``context["db"]``) or a short-lived one.
+
+        The store is shared by every request, so it never holds a session of
+        its own; the caller that put a session in the context also closes it.
+
+        The ``*_sync`` methods run in ``asyncio.to_thread`` workers, so one
+        request's session is used from different threads over its lifetime.
+        Sessions are not thread-safe; this is only sound because a request
+        awaits each store call before making the next. Do not gather several
+        store calls that share a context.
+        """
+        db = context.get("db") if context else None
+        if db is not None:
+            yield db
+            return
+        db = self.session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
 
     @staticmethod
     def _coerce_thread_metadata(thread: ThreadMetadata | Thread) -> ThreadMetadata:
-        """Return thread metadata without any embedded items."""
-        has_items = isinstance(thread, Thread) or "items" in getattr(
-            thread, "model_fields_set", set()
+        """Return thread metadata without any embedded items.
+
+        save_thread only reads scalar fields before writing them to the
+        database, so no deep copy is made. Threads are narrowed with a
+        field-by-field copy instead of a dump and re-validation.
+        """
+        if not isinstance(thread, Thread) and "items" not in thread.model_fields_set:
+            return thread
+        return ThreadMetadata.model_construct(
+            **{name: getattr(thread, name) for name in _THREAD_METADATA_FIELDS}
         )
-        if not has_items:
-            return thread.model_copy(deep=True)
-
-        data = thread.model_dump()
-        data.pop("items", None)
-        return ThreadMetadata(**data).model_copy(deep=True)
 
     # -- Thread metadata -------------------------------------------------
     async def load_thread(self, thread_id: str, context: dict[str, Any]) -> ThreadMetadata:
-        try:
-            thread_db = self.db.query(ThreadDB).filter(ThreadDB.id == thread_id).first()
-            if not thread_db:
-                raise NotFoundError(f"Thread {thread_id} not found")
-
-            return ThreadMetadata(
-                id=thread_db.id,
-                created_at=thread_db.created_at,
-                title=thread_db.title,
-            )
-        except Exception:
-            self.db.rollback()
-            raise
+        return await asyncio.to_thread(self._load_thread_sync, thread_id, context)
 
-    async def save_thread(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
-        metadata = self._coerce_thread_metadata(thread)
-        thread_db = self.db.query(ThreadDB).filter(ThreadDB.id == metadata.id).first()
+    def _load_thread_sync(self, thread_id: str, context: dict[str, Any]) -> ThreadMetadata:
+        with self._session(context) as db:
+            try:
+                thread_db = db.query(ThreadDB).filter(ThreadDB.id == thread_id).first()
+                if not thread_db:
+                    raise NotFoundError(f"Thread {thread_id} not found")
+
+                return ThreadMetadata(
+                    id=thread_db.id,
+                    created_at=thread_db.created_at,
+                    title=thread_db.title,
+                )
+            except Exception:
+                db.rollback()
+                raise
 
-        if thread_db:
-            thread_db.title = metadata.title
-            thread_db.updated_at = datetime.utcnow()
-        else:
-            thread_db = ThreadDB(
-                id=metadata.id,
-                title=metadata.title,
-                created_at=metadata.created_at or datetime.utcnow(),
-            )
-            self.db.add(thread_db)
+    async def save_thread(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._save_thread_sync, thread, context)
+
+    def _save_thread_sync(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
+        with self._session(context) as db:
+            metadata = self._coerce_thread_metadata(thread)
+            thread_db = db.query(ThreadDB).filter(ThreadDB.id == metadata.id).first()
+
+            if thread_db:
+                thread_db.title = metadata.title
+                thread_db.updated_at = datetime.utcnow()
+            else:
+                thread_db = ThreadDB(
+                    id=metadata.id,
+                    title=metadata.title,
+                    created_at=metadata.created_at or datetime.utcnow(),
+                )
+                db.add(thread_db)
 
-        self.db.commit()
+            db.commit()
 
     async def load_threads(
         self,
@@ -98,35 +147,44 @@ class PostgreSQLStore(Store[dict[str, Any]]):
         order: str,
         context: dict[str, Any],
     ) -> Page[ThreadMetadata]:
-        query = self.db.query(ThreadDB)
-
-        if after:
-            after_thread = self.db.query(ThreadDB).filter(ThreadDB.id == after).first()
-            if after_thread:
-                if order == "desc":
-                    query = query.filter(ThreadDB.created_at < after_thread.created_at)
-                else:
-                    query = query.filter(ThreadDB.created_at > after_thread.created_at)
-
-        if order == "desc":
-            threads = query.order_by(ThreadDB.created_at.desc()).limit(limit + 1).all()
-        else:
-            threads = query.order_by(ThreadDB.created_at.asc()).limit(limit + 1).all()
+        return await asyncio.to_thread(self._load_threads_sync, limit, after, order, context)
+
+    def _load_threads_sync(
+        self,
+        limit: int,
+        after: str | None,
+        order: str,
+        context: dict[str, Any],
+    ) -> Page[ThreadMetadata]:
+        with self._session(context) as db:
+            query = db.query(ThreadDB)
 
-        has_more = len(threads) > limit
-        threads = threads[:limit]
+            if after:
+                query = query.filter(_after_cursor(ThreadDB, ThreadDB.id == after, order))
 
-        thread_metas = [
-            ThreadMetadata(id=t.id, created_at=t.created_at, title=t.title)
-            for t in threads
-        ]
+            if order == "desc":
+                threads = query.order_by(ThreadDB.created_at.desc()).limit(limit + 1).all()
+            else:
+                threads = query.order_by(ThreadDB.created_at.asc()).limit(limit + 1).all()
 
-        next_after = threads[-1].id if has_more and threads else None
-        return Page(data=thread_metas, has_more=has_more, after=next_after)
+            has_more = len(threads) > limit
+            threads = threads[:limit]
+
+            thread_metas = [
+                ThreadMetadata(id=t.id, created_at=t.created_at, title=t.title)
+                for t in threads
+            ]
+
+            next_after = threads[-1].id if has_more and threads else None
+            return Page(data=thread_metas, has_more=has_more, after=next_after)
 
     async def delete_thread(self, thread_id: str, context: dict[str, Any]) -> None:
-        self.db.query(ThreadDB).filter(ThreadDB.id == thread_id).delete()
-        self.db.commit()
+        await asyncio.to_thread(self._delete_thread_sync, thread_id, context)
+
+    def _delete_thread_sync(self, thread_id: str, context: dict[str, Any]) -> None:
+        with self._session(context) as db:
+            db.query(ThreadDB).filter(ThreadDB.id == thread_id).delete()
+            db.commit()
 
     # -- Thread items ----------------------------------------------------
     async def load_thread_items(
@@ -137,82 +195,133 @@ class PostgreSQLStore(Store[dict[str, Any]]):
         order: str,
         context: dict[str, Any],
     ) -> Page[ThreadItem]:
-        query = self.db.query(ThreadItemDB).filter(ThreadItemDB.thread_id == thread_id)
-
-        if after:
-            after_item = self.db.query(ThreadItemDB).filter(ThreadItemDB.id == after).first()
-            if after_item:
-                if order == "desc":
-                    query = query.filter(ThreadItemDB.created_at < after_item.created_at)
-                else:
-                    query = query.filter(ThreadItemDB.created_at > after_item.created_at)
-
-        if order == "desc":
-            items_db = query.order_by(ThreadItemDB.created_at.desc()).limit(limit + 1).all()
-        else:
-            items_db = query.order_by(ThreadItemDB.created_at.asc()).limit(limit + 1).all()
+        return await asyncio.to_thread(self._load_thread_items_sync, thread_id, after, limit, order, context)
+
+    def _load_thread_items_sync(
+        self,
+        thread_id: str,
+        after: str | None,
+        limit: int,
+        order: str,
+        context: dict[str, Any],
+    ) -> Page[ThreadItem]:
+        with self._session(context) as db:
+            query = db.query(ThreadItemDB).filter(ThreadItemDB.thread_id == thread_id)
 
-        has_more = len(items_db) > limit
-        items_db = items_db[:limit]
+            if after:
+                query = query.filter(_after_cursor(ThreadItemDB, ThreadItemDB.id == after, order))
 
-        items = [self._db_item_to_model(item_db) for item_db in items_db]
-        next_after = items_db[-1].id if has_more and items_db else None
+            if order == "desc":
+                items_db = query.order_by(ThreadItemDB.created_at.desc()).limit(limit + 1).all()
+            else:
+                items_db = query.order_by(ThreadItemDB.created_at.asc()).limit(limit + 1).all()
 
-        return Page(data=items, has_more=has_more, after=next_after)
+            has_more = len(items_db) > limit
+            items_db = items_db[:limit]
+
+            items = [self._db_item_to_model(item_db) for item_db in items_db]
+            next_after = items_db[-1].id if has_more and items_db else None
+
+            return Page(data=items, has_more=has_more, after=next_after)
 
     async def add_thread_item(
         self, thread_id: str, item: ThreadItem, context: dict[str, Any]
     ) -> None:
-        item_db = ThreadItemDB(
-            id=item.id,
-            thread_id=thread_id,
-            role=getattr(item, "role", "assistant"),
-            content=self._item_to_content(item),
-            item_type=item.__class__.__name__,
-            item_data=item.model_dump() if hasattr(item, "model_dump") else {},
-        )
-        self.db.add(item_db)
-        self.db.commit()
-
-    async def save_item(self, thread_id: str, item: ThreadItem, context: dict[str, Any]) -> None:
-        item_db = self.db.query(ThreadItemDB).filter(ThreadItemDB.id == item.id).first()
+        await asyncio.to_thread(self._add_thread_item_sync, thread_id, item, context)
 
-        if item_db:
-            item_db.content = self._item_to_content(item)
-            item_db.item_data = item.model_dump() if hasattr(item, "model_dump") else {}
-            item_db.updated_at = datetime.utcnow()
-        else:
+    def _add_thread_item_sync(
+        self, thread_id: str, item: ThreadItem, context: dict[str, Any]
+    ) -> None:
+        with self._session(context) as db:
             item_db = ThreadItemDB(
                 id=item.id,
                 thread_id=thread_id,
-                role=getattr(item, "role", "assistant"),
+                role=_item_role(item),
                 content=self._item_to_content(item),
                 item_type=item.__class__.__name__,
-                item_data=item.model_dump() if hasattr(item, "model_dump") else {},
+                item_data=self._item_data(item),
             )
-            self.db.add(item_db)
+            db.add(item_db)
+            db.commit()
+
+    async def save_item(self, thread_id: str, item: ThreadItem, context: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._save_item_sync, thread_id, item, context)
+
+    def _save_item_sync(self, thread_id: str, item: ThreadItem, context: dict[str, Any]) -> None:
+        content = self._item_to_content(item)
+        item_data = self._item_data(item)
+        with self._session(context) as db:
+            insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+            if insert is not None:
+                # One INSERT ... ON CONFLICT statement instead of SELECT + INSERT/UPDATE
+                stmt = insert(ThreadItemDB).values(
+                    id=item.id,
+                    thread_id=thread_id,
+                    role=_item_role(item),
+                    content=content,
+                    item_type=item.__class__.__name__,
+                    item_data=item_data,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ThreadItemDB.id],
+                    set_={
+                        "content": content,
+                        "item_data": item_data,
+                        "updated_at": datetime.utcnow(),
+                    },
+                )
+                db.execute(stmt)
+                db.commit()
+                return
+
+            item_db = db.query(ThreadItemDB).filter(ThreadItemDB.id == item.id).first()
+
+            if item_db:
+                item_db.content = content
+                item_db.item_data = item_data
+                item_db.updated_at = datetime.utcnow()
+            else:
+                item_db = ThreadItemDB(
+                    id=item.id,
+                    thread_id=thread_id,
+                    role=_item_role(item),
+                    content=content,
+                    item_type=item.__class__.__name__,
+                    item_data=item_data,
+                )
+                db.add(item_db)
 
-        self.db.commit()
+            db.commit()
 
     async def load_item(self, thread_id: str, item_id: str, context: dict[str, Any]) -> ThreadItem:
-        item_db = self.db.query(ThreadItemDB).filter(
-            ThreadItemDB.id == item_id,
-            ThreadItemDB.thread_id == thread_id
-        ).first()
+        return await asyncio.to_thread(self._load_item_sync, thread_id, item_id, context)
+
+    def _load_item_sync(self, thread_id: str, item_id: str, context: dict[str, Any]) -> ThreadItem:
+        with self._session(context) as db:
+            item_db = db.query(ThreadItemDB).filter(
+                ThreadItemDB.id == item_id,
+                ThreadItemDB.thread_id == thread_id
+            ).first()
 
-        if not item_db:
-            raise NotFoundError(f"Item {item_id} not found in thread {thread_id}")
+            if not item_db:
+                raise NotFoundError(f"Item {item_id} not found in thread {thread_id}")
 
-        return self._db_item_to_model(item_db)
+            return self._db_item_to_model(item_db)
 
     async def delete_thread_item(
         self, thread_id: str, item_id: str, context: dict[str, Any]
     ) -> None:
-        self.db.query(ThreadItemDB).filter(
-            ThreadItemDB.id == item_id,
-            ThreadItemDB.thread_id == thread_id
-        ).delete()
-        self.db.commit()
+        await asyncio.to_thread(self._delete_thread_item_sync, thread_id, item_id, context)
+
+    def _delete_thread_item_sync(
+        self, thread_id: str, item_id: str, context: dict[str, Any]
+    ) -> None:
+        with self._session(context) as db:
+            db.query(ThreadItemDB).filter(
+                ThreadItemDB.id == item_id,
+                ThreadItemDB.thread_id == thread_id
+            ).delete()
+            db.commit()
 
     # -- Files -----------------------------------------------------------
     async def save_attachment(
@@ -239,6 +348,15 @@ class PostgreSQLStore(Store[dict[str, Any]]):
         )
 
     # -- Helpers ---------------------------------------------------------
+    @staticmethod
+    def _item_data(item: ThreadItem) -> dict[str, Any]:
+        """Dump an item once, in JSON mode, for the ``item_data`` JSON column.
+
+        JSON mode turns datetimes and enums into plain values, so the column
+        serializer never sees Python objects it cannot encode.
+        """
+        return item.model_dump(mode="json")
+
     def _item_to_content(self, item: ThreadItem) -> str:
         """Extract text content from ThreadItem."""
         if hasattr(item, "content"):
@@ -256,7 +374,9 @@ class PostgreSQLStore(Store[dict[str, Any]]):
     def _db_item_to_model(self, item_db: ThreadItemDB) -> ThreadItem:
         """Convert database model back to ThreadItem."""
         if item_db.item_data:
-            return UserMessageItem(**item_db.item_data)
+            # Validate against the stored class so assistant/tool items round-trip
+            cls = _ITEM_CLASSES.get(item_db.item_type, UserMessageItem)
+            return cls.model_validate(item_db.item_data)
 
         # Fallback: construct UserMessageItem from basic fields
         return UserMessageItem(
@@ -0,0 +1,16 @@
+"""Response classes shared by the API servers and routers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from . import json_utils
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through ``json_utils`` (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_utils.dumps_bytes(content)
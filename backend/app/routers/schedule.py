@@ -11,6 +11,13 @@ from typing import Any
 
 from fastapi import APIRouter, Query
 
+from ..core_tools import (
+    core_assign_section,
+    core_rebalance,
+    core_show_schedule_overview,
+    core_show_unassigned,
+    core_swap,
+)
 from ..schemas import (
     AssignSectionRequest,
     HealthResponse,
@@ -18,6 +25,7 @@ from ..schemas import (
     ScheduleStateResponse,
     SwapRequest,
 )
+from ..responses import FastJSONResponse
 from ..schedule_state import SCHEDULE_MANAGER
 from ..tool_responses import (
     AssignmentResponse,
@@ -28,7 +36,7 @@ from ..tool_responses import (
 )
 
 # Create router
-router = APIRouter(prefix="/schedule", tags=["scheduling"])
+router = APIRouter(prefix="/schedule", tags=["scheduling"], default_response_class=FastJSONResponse)
 
 
 # ============================================================================
@@ -44,15 +52,16 @@ router = APIRouter(prefix="/schedule", tags=["scheduling"])
 )
 async def get_schedule_state(
     thread_id: str | None = Query(None, description="Optional ChatKit thread identifier"),
-) -> ScheduleStateResponse:
+) -> FastJSONResponse:
     """
     Get the current schedule state.
 
     Returns:
-        ScheduleStateResponse: Complete schedule state with all entities.
+        FastJSONResponse: Complete schedule state with all entities, in the
+        ScheduleStateResponse shape.
     """
-    data = SCHEDULE_MANAGER.get_state()
-    return ScheduleStateResponse(schedule=data)
+    # get_state() is already JSON-shaped, so skip the response model round trip
+    return FastJSONResponse({"schedule": SCHEDULE_MANAGER.get_state()})
 
 
 @router.get(
@@ -74,6 +83,10 @@ async def health_check() -> HealthResponse:
 # ============================================================================
 # View Endpoints (GET)
 # ============================================================================
+# Handlers that call into core_tools are plain ``def``: FastAPI runs them in its
+# threadpool, so schedule scans, chart rendering and OR-Tools solves do not
+# block the event loop. The mutating core_* functions serialize on
+# SCHEDULE_MANAGER.lock, so concurrent requests cannot interleave changes.
 
 
 @router.get(
@@ -82,28 +95,15 @@ async def health_check() -> HealthResponse:
     summary="Schedule Overview",
     description="Get an overview of the schedule including teacher workloads and assignments.",
 )
-async def get_schedule_overview() -> ScheduleOverviewResponse:
+def get_schedule_overview() -> ScheduleOverviewResponse:
     """
     Get schedule overview with teacher workload information.
 
     Returns:
         ScheduleOverviewResponse: Schedule overview with teacher load info.
     """
-    from ..core_tools import core_show_schedule_overview
-    from ..tool_responses import TeacherLoadInfo
-
-    result = core_show_schedule_overview()
-    # Construct TeacherLoadInfo objects from the teachers dict
-    teachers_with_info = {
-        tid: TeacherLoadInfo(**teacher_data) for tid, teacher_data in result["teachers"].items()
-    }
-    return ScheduleOverviewResponse(
-        message=result["message"],
-        teachers=teachers_with_info,
-        sections=result["sections"],
-        assignments=result["assignments"],
-        rooms=result["rooms"],
-    )
+    # One validation pass builds the nested TeacherLoadInfo objects as well
+    return ScheduleOverviewResponse.model_validate(core_show_schedule_overview())
 
 
 @router.get(
@@ -112,27 +112,15 @@ async def get_schedule_overview() -> ScheduleOverviewResponse:
     summary="Get Unassigned Sections",
     description="List all course sections that have not yet been assigned to a teacher.",
 )
-async def get_unassigned_sections() -> UnassignedResponse:
+def get_unassigned_sections() -> UnassignedResponse:
     """
     Get unassigned course sections.
 
     Returns:
         UnassignedResponse: List of sections awaiting assignment.
     """
-    from ..core_tools import core_show_unassigned
-    from ..tool_responses import UnassignedSection
-
-    result = core_show_unassigned()
-
-    # Construct UnassignedSection objects from core result
-    unassigned_list = [
-        UnassignedSection(**section_data) for section_data in result["unassigned_sections"]
-    ]
-
-    return UnassignedResponse(
-        message=result["message"],
-        unassigned_sections=unassigned_list,
-    )
+    # One validation pass builds the nested UnassignedSection objects as well
+    return UnassignedResponse.model_validate(core_show_unassigned())
 
 
 # ============================================================================
@@ -146,7 +134,7 @@ async def get_unassigned_sections() -> UnassignedResponse:
     summary="Assign Section to Teacher",
     description="Assign an unassigned course section to a qualified teacher.",
 )
-async def assign_section(request: AssignSectionRequest) -> AssignmentResponse:
+def assign_section(request: AssignSectionRequest) -> AssignmentResponse:
     """
     Assign a section to a teacher.
 
@@ -156,8 +144,6 @@ async def assign_section(request: AssignSectionRequest) -> AssignmentResponse:
     Returns:
         AssignmentResponse: Result of the assignment operation.
     """
-    from ..core_tools import core_assign_section
-
     result = core_assign_section(request.section_id, request.teacher)
     if "error" in result:
         return AssignmentResponse(success=False, message=result["error"])
@@ -172,7 +158,7 @@ async def assign_section(request: AssignSectionRequest) -> AssignmentResponse:
     summary="Swap Section Between Teachers",
     description="Move a course section from one teacher to another.",
 )
-async def swap_section(request: SwapRequest) -> SwapResponse:
+def swap_section(request: SwapRequest) -> SwapResponse:
     """
     Swap a section between two teachers.
 
@@ -182,8 +168,6 @@ async def swap_section(request: SwapRequest) -> SwapResponse:
     Returns:
         SwapResponse: Result of the swap operation.
     """
-    from ..core_tools import core_swap
-
     result = core_swap(request.section_id, request.from_teacher, request.to_teacher)
     if "error" in result:
         return SwapResponse(success=False, message=result["error"])
@@ -196,7 +180,7 @@ async def swap_section(request: SwapRequest) -> SwapResponse:
     summary="Rebalance Teaching Assignments",
     description="Automatically redistribute teaching assignments to balance workloads.",
 )
-async def rebalance_assignments(request: RebalanceRequest) -> RebalancingResponse:
+def rebalance_assignments(request: RebalanceRequest) -> RebalancingResponse:
     """
     Rebalance teaching assignments using specified algorithm.
 
@@ -206,7 +190,5 @@ async def rebalance_assignments(request: RebalanceRequest) -> RebalancingRespons
     Returns:
         RebalancingResponse: Changes made during rebalancing with updated statistics.
     """
-    from ..core_tools import core_rebalance
-
     result = core_rebalance(request.max_load_hours)
     return RebalancingResponse(**result)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import copy
+import functools
+import threading
 from .models import (
     TimeSlot,
     Teacher,
@@ -13,24 +15,105 @@ from .models import (
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
+from .kernels import NUMBA_AVAILABLE, find_conflicting_slots
+
 try:
     from ortools.linear_solver import pywraplp
 except ImportError:
     pywraplp = None
 
 
+# Top-level keys of the serialized state, in the order returned by get_state()
+_STATE_PARTS = ("teachers", "rooms", "sections", "assignments", "timeline")
+
+
+def _locked(method):
+    """Run a ScheduleManager method while holding the manager's lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 def _now_iso() -> str:
     """Return current time in ISO format."""
     return datetime.now(timezone.utc).isoformat()
 
 
 class ScheduleManager:
-    """Manages teacher-course assignments and timetabling."""
+    """Manages teacher-course assignments and timetabling.
+
+    Derived views (loads, serialized parts, lookup indexes) are cached per
+    state version. The manager's own methods bump the version when they
+    mutate ``state``; code that edits ``state`` directly must call
+    :meth:`invalidate` afterwards, or swap it wholesale with
+    :meth:`replace_state`.
+
+    Mutating methods hold ``lock``, a re-entrant lock, so requests served
+    from worker threads cannot interleave their changes.
+    """
 
     def __init__(self):
+        # Held by every mutation; callers that check the state and then change
+        # it (e.g. core_tools.core_assign_section) hold it across both steps
+        self.lock = threading.RLock()
         self.state = ScheduleState()
+        # Bumped on every mutation so derived views can be cached between changes
+        self._state_version = 0
+        self._part_versions = dict.fromkeys(_STATE_PARTS, 0)
+        self._loads_cache: tuple[int, dict[str, float]] | None = None
+        self._serialized_cache: dict[str, tuple[int, Any]] = {}
+        self._slot_arrays_cache: tuple[int, dict[str, Any]] | None = None
+        self._name_index_cache: tuple[int, dict[str, str]] | None = None
+        self._assigned_count_cache: tuple[int, int] | None = None
+        # Formatted workload lines keyed by (teacher_id, load); see teacher_load_line()
+        self._line_cache: tuple[int, dict[tuple[str, float], str]] | None = None
         self._initialize_sample_data()
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the schedule state is mutated."""
+        return self._state_version
+
+    def _bump_version(self, *parts: str) -> None:
+        """Invalidate cached views of the state after a mutation.
+
+        ``parts`` names the top-level state collections that changed; when
+        omitted, every collection is considered stale.
+        """
+        self._state_version += 1
+        for part in parts or _STATE_PARTS:
+            self._part_versions[part] += 1
+
+    @_locked
+    def invalidate(self, *parts: str) -> None:
+        """Drop cached views after ``state`` was modified directly.
+
+        ``parts`` may name the changed collections (``"teachers"``, ``"rooms"``,
+        ``"sections"``, ``"assignments"``, ``"timeline"``); by default all of
+        them are treated as changed.
+        """
+        unknown = set(parts).difference(_STATE_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown state parts: {sorted(unknown)}")
+        self._bump_version(*parts)
+
+    @_locked
+    def replace_state(self, state: ScheduleState) -> None:
+        """Install a new schedule state and invalidate every cached view."""
+        self.state = state
+        self._bump_version()
+
+    def _log(self, kind: TimelineEntryKind, message: str) -> None:
+        """Add a timeline entry to the current state."""
+        self.state.add_timeline_entry(kind, message)
+        self._bump_version("timeline")
+
     def _initialize_sample_data(self):
         """Create sample university data for testing."""
         # Exact toy_state requested by the user
@@ -134,61 +217,211 @@ class ScheduleManager:
         self.state.rooms = rooms
         self.state.sections = sections
         self.state.assignments = assignments
+        self._bump_version()
 
-        self.state.add_timeline_entry(TimelineEntryKind.SYSTEM, "Scheduling data loaded")
+        self._log(TimelineEntryKind.SYSTEM, "Scheduling data loaded")
+
+    def _serialize_teachers(self) -> dict[str, Any]:
+        return {tid: teacher.model_dump() for tid, teacher in self.state.teachers.items()}
+
+    def _serialize_rooms(self) -> dict[str, Any]:
+        return {rid: room.model_dump() for rid, room in self.state.rooms.items()}
+
+    def _serialize_sections(self) -> dict[str, Any]:
+        return {sid: section.model_dump() for sid, section in self.state.sections.items()}
+
+    def _serialize_assignments(self) -> dict[str, Any]:
+        return {aid: assignment.model_dump() for aid, assignment in self.state.assignments.items()}
+
+    def _serialize_timeline(self) -> list[dict[str, Any]]:
+        return [entry.model_dump() for entry in self.state.timeline]
+
+    def _serialized_part(self, part: str) -> Any:
+        """Serialize one top-level collection, reusing the cached copy if unchanged."""
+        version = self._part_versions[part]
+        cached = self._serialized_cache.get(part)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = getattr(self, f"_serialize_{part}")()
+        self._serialized_cache[part] = (version, value)
+        return value
 
     def get_state(self) -> dict[str, Any]:
-        """Get the current state as a dictionary."""
-        return {
-            "teachers": {tid: teacher.model_dump() for tid, teacher in self.state.teachers.items()},
-            "rooms": {rid: room.model_dump() for rid, room in self.state.rooms.items()},
-            "sections": {sid: section.model_dump() for sid, section in self.state.sections.items()},
-            "assignments": {
-                aid: assignment.model_dump() for aid, assignment in self.state.assignments.items()
-            },
-            "timeline": [entry.model_dump() for entry in self.state.timeline],
-        }
+        """Get the current state as a dictionary.
+
+        Each collection is serialized once and reused until it is next mutated,
+        so callers must treat the returned data as read-only.
+        """
+        return {part: self._serialized_part(part) for part in _STATE_PARTS}
+
+    def snapshot_assignment_teachers(self) -> dict[str, str | None]:
+        """Get the teacher ID currently assigned to each section."""
+        return {sid: a.teacher_id for sid, a in self.state.assignments.items()}
+
+    def assigned_count(self) -> int:
+        """Count the sections that currently have a teacher."""
+        version = self._part_versions["assignments"]
+        cached = self._assigned_count_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        count = sum(1 for a in self.state.assignments.values() if a.teacher_id)
+        self._assigned_count_cache = (version, count)
+        return count
+
+    def unassigned_count(self) -> int:
+        """Count the sections that do not have a teacher yet."""
+        return len(self.state.sections) - self.assigned_count()
+
+    def teacher_load_line(self, teacher_id: str, load: float) -> str:
+        """Format a teacher's workload summary line for the agent context.
+
+        Lines only change when the teacher's load or record changes, so they
+        are cached per load and dropped whenever the teachers change.
+        """
+        version = self._part_versions["teachers"]
+        cached = self._line_cache
+        if cached is None or cached[0] != version:
+            cached = self._line_cache = (version, {})
+        lines = cached[1]
+        key = (teacher_id, load)
+        line = lines.get(key)
+        if line is None:
+            teacher = self.state.teachers[teacher_id]
+            max_load = teacher.max_load_hours
+            utilization = (load / max_load * 100) if max_load > 0 else 0
+            line = "- %s (qualified: %s): %.1f/%.1f hours (%.1f%%)" % (
+                teacher.name,
+                ", ".join(teacher.qualified_courses),
+                load,
+                max_load,
+                utilization,
+            )
+            lines[key] = line
+        return line
 
     def compute_teacher_load(self, teacher: Teacher) -> float:
         """Calculate the total teaching load for a teacher."""
-        total_hours = 0.0
+        # O(1) lookup into the per-version load table instead of an assignment scan
+        return self.compute_all_loads().get(teacher.id, 0.0)
+
+    def compute_all_loads(self) -> dict[str, float]:
+        """Calculate the teaching load for every teacher in a single pass.
+
+        The result is cached until the next state mutation, so callers must not
+        modify the returned dictionary.
+        """
+        # Read before computing: a concurrent mutation must not get stale loads
+        # stamped with its new version
+        version = self._state_version
+        cached = self._loads_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        loads = dict.fromkeys(self.state.teachers, 0.0)
+        sections = self.state.sections
         for assignment in self.state.assignments.values():
-            if assignment.teacher_id == teacher.id:
-                section = self.state.sections[assignment.section_id]
-                total_hours += section.compute_weekly_hours()
-        return total_hours
+            teacher_id = assignment.teacher_id
+            if teacher_id:
+                hours = sections[assignment.section_id].duration_hours
+                loads[teacher_id] = loads.get(teacher_id, 0.0) + hours
+
+        self._loads_cache = (version, loads)
+        return loads
 
     def find_overload(self) -> list[tuple[str, float, float]]:
         """Find teachers who are over their maximum load."""
+        loads = self.compute_all_loads()
         overloads = []
         for teacher_id, teacher in self.state.teachers.items():
-            current_load = self.compute_teacher_load(teacher)
+            current_load = loads[teacher_id]
             if current_load > teacher.max_load_hours:
                 overloads.append((teacher_id, current_load, teacher.max_load_hours))
         return overloads
 
+    def _slot_arrays(self) -> dict[str, Any]:
+        """Flatten the timeslots of all staffed assignments into parallel arrays.
+
+        One entry per timeslot, in assignment order. The arrays are rebuilt only
+        when the state version changes.
+        """
+        # Read first so a concurrent mutation cannot stamp these arrays as current
+        version = self._state_version
+        cached = self._slot_arrays_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        teacher_index: dict[str, int] = {}
+        order, teacher, day, start, end = [], [], [], [], []
+        slot_assignment: list[tuple[str, str]] = []
+        sections = self.state.sections
+        for position, assignment in enumerate(self.state.assignments.values()):
+            teacher_id = assignment.teacher_id
+            if not teacher_id:
+                continue
+            t_idx = teacher_index.setdefault(teacher_id, len(teacher_index))
+            for timeslot in sections[assignment.section_id].timeslots:
+                order.append(position)
+                teacher.append(t_idx)
+                day.append(int(timeslot.day))
+                start.append(timeslot.start_hour)
+                end.append(timeslot.end_hour)
+                slot_assignment.append((teacher_id, assignment.section_id))
+
+        arrays = {
+            "ts_order": np.array(order, dtype=np.int32),
+            "ts_teacher": np.array(teacher, dtype=np.int32),
+            "ts_day": np.array(day, dtype=np.int8),
+            "ts_start": np.array(start, dtype=np.float64),
+            "ts_end": np.array(end, dtype=np.float64),
+            "slot_assignment": slot_assignment,
+        }
+        self._slot_arrays_cache = (version, arrays)
+        return arrays
+
     def find_conflicting_assignments(self) -> list[tuple[str, str]]:
-        """Find teachers with conflicting time slots."""
+        """Find teachers with conflicting time slots.
+
+        Each timeslot of an assignment that overlaps a timeslot of an earlier
+        assignment for the same teacher yields one ``(teacher_id, section_id)``.
+        """
+        if not NUMBA_AVAILABLE:
+            return self._find_conflicting_assignments_py()
+
+        arrays = self._slot_arrays()
+        flagged = find_conflicting_slots(
+            arrays["ts_order"],
+            arrays["ts_teacher"],
+            arrays["ts_day"],
+            arrays["ts_start"],
+            arrays["ts_end"],
+        )
+        slot_assignment = arrays["slot_assignment"]
+        return [slot_assignment[i] for i in np.flatnonzero(flagged)]
+
+    def _find_conflicting_assignments_py(self) -> list[tuple[str, str]]:
+        """Pure-Python conflict scan, used when the Numba kernel is unavailable."""
         conflicts = []
-        teacher_schedules = {}
+        teacher_slots: dict[str, list[TimeSlot]] = {}
+        sections = self.state.sections
 
         for assignment in self.state.assignments.values():
-            if assignment.teacher_id:
-                section = self.state.sections[assignment.section_id]
-                if assignment.teacher_id not in teacher_schedules:
-                    teacher_schedules[assignment.teacher_id] = []
-
-                # Check for time conflicts with all timeslots
-                for timeslot in section.timeslots:
-                    for existing_slot in teacher_schedules[assignment.teacher_id]:
-                        if timeslot.day == existing_slot.day and not (
-                            timeslot.end_hour <= existing_slot.start_hour
-                            or timeslot.start_hour >= existing_slot.end_hour
-                        ):
-                            conflicts.append((assignment.teacher_id, assignment.section_id))
-                            break
+            teacher_id = assignment.teacher_id
+            if not teacher_id:
+                continue
+            timeslots = sections[assignment.section_id].timeslots
+            existing = teacher_slots.setdefault(teacher_id, [])
+
+            for timeslot in timeslots:
+                for existing_slot in existing:
+                    if timeslot.day == existing_slot.day and not (
+                        timeslot.end_hour <= existing_slot.start_hour
+                        or timeslot.start_hour >= existing_slot.end_hour
+                    ):
+                        conflicts.append((teacher_id, assignment.section_id))
+                        break
 
-                teacher_schedules[assignment.teacher_id].extend(section.timeslots)
+            existing.extend(timeslots)
 
         return conflicts
 
@@ -198,13 +431,26 @@ class ScheduleManager:
         if name_or_id in self.state.teachers:
             return name_or_id
 
-        # Try name lookup
-        for teacher_id, teacher in self.state.teachers.items():
-            if teacher.name.lower() == name_or_id.lower():
-                return teacher_id
+        # Try case-insensitive name lookup
+        return self._teacher_name_index().get(name_or_id.lower())
 
-        return None
+    def _teacher_name_index(self) -> dict[str, str]:
+        """Map lower-cased teacher names to IDs, rebuilt when teachers change.
 
+        When two teachers share a name, the first one in the roster wins.
+        """
+        version = self._part_versions["teachers"]
+        cached = self._name_index_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        index: dict[str, str] = {}
+        for teacher_id, teacher in self.state.teachers.items():
+            index.setdefault(teacher.name.lower(), teacher_id)
+        self._name_index_cache = (version, index)
+        return index
+
+    @_locked
     def try_swap(
         self, section_id: str, from_teacher_id: str, to_teacher_id: str
     ) -> tuple[bool, str]:
@@ -240,26 +486,26 @@ class ScheduleManager:
         # Perform the swap
         assignment.teacher_id = to_teacher_id
         assignment.assigned_at = _now_iso()
+        self._bump_version("assignments")
 
         from_teacher_name = self.state.teachers[from_teacher_id].name
         to_teacher_name = self.state.teachers[to_teacher_id].name
 
-        self.state.add_timeline_entry(
+        self._log(
             TimelineEntryKind.ASSIGNMENT,
             f"Swapped {section_id} from {from_teacher_name} to {to_teacher_name}",
         )
 
         return True, "Swap successful"
 
+    @_locked
     def greedy_rebalance(self, max_load_hours: float | None = None) -> ScheduleState:
         """Perform a greedy rebalancing to distribute teaching loads more evenly."""
         # Work directly on current state assignments
         moved_assignments = []
 
-        # Calculate current loads
-        teacher_loads = {}
-        for teacher_id, teacher in self.state.teachers.items():
-            teacher_loads[teacher_id] = self.compute_teacher_load(teacher)
+        # Calculate current loads (a private copy, updated as sections move)
+        teacher_loads = dict(self.compute_all_loads())
 
         # Find assignments that can be moved to balance load
         for assignment in self.state.assignments.values():
@@ -297,6 +543,7 @@ class ScheduleManager:
 
                     assignment.teacher_id = best_teacher
                     assignment.assigned_at = _now_iso()
+                    self._bump_version("assignments")
 
                     # Update our tracking
                     teacher_loads[current_teacher.id] -= section_hours
@@ -311,7 +558,7 @@ class ScheduleManager:
                         }
                     )
 
-                    self.state.add_timeline_entry(
+                    self._log(
                         TimelineEntryKind.REBALANCING,
                         f"Rebalanced: moved {assignment.section_id} from {old_teacher_name} to {new_teacher_name}",
                     )
@@ -319,11 +566,12 @@ class ScheduleManager:
         # Return current state (which has been modified)
         return self.state
 
+    @_locked
     def optimal_rebalance(self, max_load_hours: float | None = None) -> ScheduleState:
         """Perform optimal rebalancing using OR-Tools to minimize load variance."""
         # Check if OR-Tools is available
         if pywraplp is None:
-            self.state.add_timeline_entry(
+            self._log(
                 TimelineEntryKind.SYSTEM,
                 "OR-Tools not available, falling back to greedy rebalancing",
             )
@@ -336,7 +584,7 @@ class ScheduleManager:
         solver = pywraplp.Solver.CreateSolver("SCIP")
         if not solver:
             # Fall back to greedy if OR-Tools solver not available
-            self.state.add_timeline_entry(
+            self._log(
                 TimelineEntryKind.SYSTEM,
                 "OR-Tools solver not available, falling back to greedy rebalancing",
             )
@@ -440,6 +688,7 @@ class ScheduleManager:
 
             # Update the manager's state
             self.state = new_state
+            self._bump_version("assignments", "timeline")
             return new_state
         else:
             # If no feasible solution found, fall back to greedy
@@ -457,6 +706,13 @@ class ScheduleManager:
                 total_hours += section.compute_weekly_hours()
         return total_hours
 
+    @_locked
+    def assign_teacher(self, section_id: str, teacher_id: str) -> None:
+        """Assign a teacher to an existing section assignment."""
+        self.state.assignments[section_id].teacher_id = teacher_id
+        self._bump_version("assignments")
+
+    @_locked
     def reset_schedule(self) -> dict[str, Any]:
         """Reset the schedule to its initial state with sample data."""
         self.state = ScheduleState()
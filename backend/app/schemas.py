@@ -4,8 +4,9 @@ Request and response schemas for FastAPI endpoints.
 These Pydantic models provide type-safe request body validation and response serialization.
 """
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import Literal
 
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 # ============================================================================
 # Request Schemas (Input DTOs)
@@ -97,9 +98,8 @@ class RebalanceRequest(BaseModel):
     max_load_hours: float | None = Field(
         None, description="Optional override for maximum load hours"
     )
-    algorithm: str = Field(
+    algorithm: Literal["greedy", "optimal"] = Field(
         default="greedy",
-        pattern="^(greedy|optimal)$",
         description="Rebalancing algorithm: 'greedy' or 'optimal'",
     )
 
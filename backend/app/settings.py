@@ -6,6 +6,7 @@ with support for environment variables, default values, and validation.
 """
 
 import os
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import ConfigDict, Field, field_validator
@@ -192,6 +193,8 @@ def reload_settings() -> None:
     global app_settings, llm_config
     app_settings = AppSettings()
     llm_config = LLMConfig()
+    # The backend may have changed
+    get_app.cache_clear()
 
 
 # Backward compatibility functions for existing code
@@ -217,10 +220,14 @@ def get_llm_config_dict() -> dict:
     return result
 
 
+@lru_cache(maxsize=1)
 def get_app():
     """
     Get the FastAPI application instance based on configured backend.
 
+    The result is cached, so the database is initialized and the server
+    module imported only on the first call.
+
     Returns:
         FastAPI application instance for the selected backend.
     """
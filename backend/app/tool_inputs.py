@@ -3,39 +3,48 @@
 These Pydantic models provide argument validation, type safety, and documentation
 for both OpenAI and LangGraph tool functions. They are shared across all agent backends
 to maintain consistency.
+
+Arguments come from the model's function calls, which are already limited to
+the declared parameters, so unknown keys are dropped rather than rejected.
+The HTTP request schemas in ``schemas.py`` keep ``extra="forbid"``.
 """
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
+# Non-empty identifier/name argument; one validator reused by every such field
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1, strip_whitespace=True)]
 
-class ShowScheduleOverviewInput(BaseModel):
-    """Input model for show_schedule_overview tool."""
 
-    model_config = ConfigDict(extra="forbid")
+class NoArgsInput(BaseModel):
+    """Input model shared by all tools that take no arguments."""
 
+    model_config = ConfigDict(extra="ignore")
 
-class ShowLoadDistributionInput(BaseModel):
-    """Input model for show_load_distribution tool."""
 
-    model_config = ConfigDict(extra="forbid")
+# Zero-argument tools share one schema (and one compiled validator)
+ShowScheduleOverviewInput = NoArgsInput
+ShowLoadDistributionInput = NoArgsInput
+ShowUnassignedInput = NoArgsInput
+ResetScheduleInput = NoArgsInput
 
 
 class ShowViolationsInput(BaseModel):
     """Input model for show_violations tool."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
 
-    type: str = Field(
+    type: Literal["overload", "conflict"] = Field(
         ...,
         description="Type of violations to check: 'overload' (teacher exceeds max hours) or 'conflict' (teacher has scheduling conflicts)",
-        pattern="^(overload|conflict)$",
     )
 
 
 class RebalanceInput(BaseModel):
     """Input model for rebalance tool."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
 
     max_load_hours: float | None = Field(
         None,
@@ -47,39 +56,25 @@ class RebalanceInput(BaseModel):
 class SwapInput(BaseModel):
     """Input model for swap tool."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
 
-    section_id: str = Field(
-        ..., min_length=1, description="ID of the section to swap (e.g., 'CS101-A')"
-    )
-    from_teacher: str = Field(
-        ..., min_length=1, description="Name or ID of the teacher who currently has the section"
+    section_id: NonEmptyStr = Field(..., description="ID of the section to swap (e.g., 'CS101-A')")
+    from_teacher: NonEmptyStr = Field(
+        ..., description="Name or ID of the teacher who currently has the section"
     )
-    to_teacher: str = Field(
-        ..., min_length=1, description="Name or ID of the teacher to assign the section to"
+    to_teacher: NonEmptyStr = Field(
+        ..., description="Name or ID of the teacher to assign the section to"
     )
 
 
-class ShowUnassignedInput(BaseModel):
-    """Input model for show_unassigned tool."""
-
-    model_config = ConfigDict(extra="forbid")
-
-
 class AssignSectionInput(BaseModel):
     """Input model for assign_section tool."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
 
-    section_id: str = Field(
-        ..., min_length=1, description="ID of the unassigned section (e.g., 'CS101-B')"
+    section_id: NonEmptyStr = Field(
+        ..., description="ID of the unassigned section (e.g., 'CS101-B')"
     )
-    teacher: str = Field(
-        ..., min_length=1, description="Name or ID of the teacher to assign the section to"
+    teacher: NonEmptyStr = Field(
+        ..., description="Name or ID of the teacher to assign the section to"
     )
-
-
-class ResetScheduleInput(BaseModel):
-    """Input model for reset_schedule tool."""
-
-    model_config = ConfigDict(extra="forbid")
@@ -40,6 +40,9 @@ class LoadDistributionResponse(BaseModel):
 
     message: str = Field(..., min_length=1, description="Status message")
     histogram_path: str | None = Field(None, description="Path to generated histogram image")
+    histogram: dict[str, list[float]] | None = Field(
+        None, description="Histogram bins as 'counts' per bin and bin 'edges'"
+    )
     loads: dict[str, float] = Field(..., description="Teacher name to load mapping")
     statistics: dict[str, float] | None = Field(None, description="Load distribution statistics")
 
@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the backend test suite."""
+
+import os
+
+# Point the app at an in-memory SQLite database before any test imports
+# app.database, so test runs never leave a test.db file in the tree.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -2,16 +2,31 @@
 Test suite for Pydantic models, settings, and migration functionality.
 """
 
+import json
 import os
 import sys
 
+import pytest
 from pydantic import ValidationError
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.migration import convert_legacy_schedule_state, export_to_legacy_format
-from app.models import CourseSection, Room, Teacher, TimeSlot, WeekDay
+from app.migration import (
+    convert_legacy_schedule_state,
+    export_to_legacy_format,
+    export_to_legacy_json,
+)
+from app.models import (
+    CourseSection,
+    Room,
+    ScheduleState,
+    Teacher,
+    TimelineEntry,
+    TimelineEntryKind,
+    TimeSlot,
+    WeekDay,
+)
 from app.settings import AppSettings, LLMConfig
 
 
@@ -102,6 +117,101 @@ def test_migration():
     print("✅ Migration test passed!\n")
 
 
+def test_trusted_migration_round_trip():
+    """Trusted conversion skips validation but yields the same legacy export."""
+    legacy_data = {
+        "teachers": {
+            "t1": {
+                "id": "t1",
+                "name": "Dr. Alice",
+                "max_load_hours": 12.0,
+                "qualified_courses": ["CS101"],
+                "availability": [{"day": 1, "start_hour": 9.0, "end_hour": 17.0}],
+            }
+        },
+        "rooms": {"r1": {"id": "r1", "capacity": 30, "features": ["projector"]}},
+        "sections": {
+            "s1": {
+                "id": "s1",
+                "course_code": "CS101",
+                "timeslots": [{"day": 2, "start_hour": 9.0, "end_hour": 10.5}],
+                "enrollment": 25,
+                "required_feature": "projector",
+            }
+        },
+        "assignments": {"s1": {"section_id": "s1", "teacher_id": "t1", "room_id": "r1"}},
+        "timeline": [{"kind": "system", "entry": "Imported"}],
+    }
+
+    validated = export_to_legacy_format(convert_legacy_schedule_state(legacy_data))
+    trusted = export_to_legacy_format(convert_legacy_schedule_state(legacy_data, trusted=True))
+    for exported in (validated, trusted):
+        exported["timeline"][0].pop("timestamp")
+    assert trusted == validated
+
+
+def test_legacy_json_export_matches_dict_export():
+    """The direct JSON export encodes the same document as the dict export."""
+    legacy_data = {
+        "teachers": {
+            "t1": {
+                "id": "t1",
+                "name": "Dr. Alice",
+                "max_load_hours": 12.0,
+                "qualified_courses": ["CS101"],
+                "availability": [{"day": 1, "start_hour": 9.0, "end_hour": 17.0}],
+            }
+        },
+        "rooms": {"r1": {"id": "r1", "capacity": 30, "features": ["projector"]}},
+        "sections": {},
+        "assignments": {},
+        "timeline": [{"kind": "system", "entry": "Imported"}],
+    }
+    schedule = convert_legacy_schedule_state(legacy_data)
+
+    assert json.loads(export_to_legacy_json(schedule)) == export_to_legacy_format(schedule)
+
+
+def test_legacy_export_keeps_isoformat_timestamps():
+    """Both legacy exports write timestamps as datetime.isoformat() did."""
+    stamp = "2024-01-15T09:30:00+00:00"
+    schedule = ScheduleState(
+        timeline=[TimelineEntry(kind=TimelineEntryKind.SYSTEM, entry="Imported", timestamp=stamp)]
+    )
+
+    assert export_to_legacy_format(schedule)["timeline"][0]["timestamp"] == stamp
+    assert json.loads(export_to_legacy_json(schedule))["timeline"][0]["timestamp"] == stamp
+    # Outside the legacy export pydantic's own "Z" form is unchanged
+    assert schedule.model_dump(mode="json")["timeline"][0]["timestamp"] == "2024-01-15T09:30:00Z"
+
+
+def test_overlapping_slots_detected_out_of_order():
+    """Overlaps are found regardless of slot order; back-to-back slots are allowed."""
+    slots = [
+        TimeSlot(day=WeekDay.MONDAY, start_hour=13.0, end_hour=14.0),
+        TimeSlot(day=WeekDay.TUESDAY, start_hour=9.0, end_hour=12.0),
+        TimeSlot(day=WeekDay.MONDAY, start_hour=9.0, end_hour=13.5),
+    ]
+    try:
+        Teacher(
+            id="t1", name="A", email="a@university.edu", max_load_hours=10.0, availability=slots
+        )
+        assert False, "Should have failed validation"
+    except ValidationError as e:
+        assert "Overlapping availability slots" in str(e)
+
+    Teacher(
+        id="t1",
+        name="A",
+        email="a@university.edu",
+        max_load_hours=10.0,
+        availability=[
+            TimeSlot(day=WeekDay.MONDAY, start_hour=11.0, end_hour=12.0),
+            TimeSlot(day=WeekDay.MONDAY, start_hour=9.0, end_hour=11.0),
+        ],
+    )
+
+
 def test_validation():
     """Test Pydantic validation features."""
     print("🧪 Testing Pydantic validation...")
@@ -130,6 +240,36 @@ def test_validation():
     print("✅ Validation test passed!\n")
 
 
+def test_section_duration_cache():
+    """Test that the cached section duration follows timeslot reassignment."""
+    section = CourseSection(
+        id="cs101_001",
+        course_code="CS101",
+        timeslots=[TimeSlot(day=WeekDay.MONDAY, start_hour=9.0, end_hour=10.5)],
+        enrollment=25,
+    )
+    assert section.duration_hours == 1.5
+
+    section.timeslots = [
+        TimeSlot(day=WeekDay.MONDAY, start_hour=9.0, end_hour=11.0),
+        TimeSlot(day=WeekDay.TUESDAY, start_hour=9.0, end_hour=10.0),
+    ]
+    assert section.duration_hours == 3.0
+    assert section.compute_weekly_hours() == 3.0
+    assert "duration_hours" not in section.model_dump()
+
+    # Slots cannot be edited in place, and copies recompute the duration
+    with pytest.raises(AttributeError):
+        section.timeslots.append(TimeSlot(day=WeekDay.WEDNESDAY, start_hour=9.0, end_hour=11.0))
+    with pytest.raises(ValidationError):
+        section.timeslots[0].end_hour = 12.0
+    copied = section.model_copy(
+        update={"timeslots": [TimeSlot(day=WeekDay.MONDAY, start_hour=9.0, end_hour=13.0)]}
+    )
+    assert copied.duration_hours == 4.0
+    assert section.duration_hours == 3.0
+
+
 if __name__ == "__main__":
     print("🎯 Starting Pydantic model tests...\n")
 
@@ -137,5 +277,6 @@ if __name__ == "__main__":
     test_settings()
     test_migration()
     test_validation()
+    test_section_duration_cache()
 
     print("🎉 All tests passed! Pydantic refactoring is successful!")
@@ -97,6 +97,7 @@ class TestRebalancing:
             ),  # Chen: 2 hours
             # Bob gets nothing (0 hours)
         }
+        self.manager.invalidate()
 
     def test_compute_teacher_loads_before_rebalancing(self):
         """Test that we can compute teacher loads correctly."""
@@ -119,6 +120,61 @@ class TestRebalancing:
         # Chen should have 2 hours
         assert chen_load == 2.0, f"Chen should have 2 hours, got {chen_load}"
 
+    def test_compute_all_loads_matches_per_teacher_loads(self):
+        """Test that the cached load table agrees with per-teacher computation."""
+        self.create_unbalanced_scenario()
+
+        loads = self.manager.compute_all_loads()
+        assert loads == {"t_alice": 8.0, "t_bob": 0.0, "t_chen": 2.0}
+
+        # Rebalancing mutates the state, so the cached table must be refreshed
+        self.manager.optimal_rebalance()
+        loads = self.manager.compute_all_loads()
+        for teacher_id, teacher in self.manager.state.teachers.items():
+            assert loads[teacher_id] == self.manager.compute_teacher_load(teacher)
+
+    def test_invalidate_after_direct_state_edit(self):
+        """Test that invalidate() and replace_state() refresh the cached views."""
+        self.create_unbalanced_scenario()
+        assert self.manager.compute_all_loads()["t_alice"] == 8.0
+
+        for assignment in self.manager.state.assignments.values():
+            assignment.teacher_id = None
+        self.manager.invalidate("assignments")
+        assert self.manager.compute_all_loads() == {"t_alice": 0.0, "t_bob": 0.0, "t_chen": 0.0}
+
+        self.manager.replace_state(ScheduleManager().state)
+        assert self.manager.get_state()["assignments"]["CS101-A"]["teacher_id"] == "t_alice"
+
+    def test_get_state_reflects_mutations(self):
+        """Test that the cached serialized state is refreshed after a swap."""
+        before = self.manager.get_state()
+        assert before["assignments"]["CS101-A"]["teacher_id"] == "t_alice"
+        assert self.manager.get_state()["teachers"] is before["teachers"]
+
+        success, _ = self.manager.try_swap("CS101-A", "t_alice", "t_bob")
+        assert success
+
+        after = self.manager.get_state()
+        assert after["assignments"]["CS101-A"]["teacher_id"] == "t_bob"
+        assert len(after["timeline"]) == len(before["timeline"]) + 1
+        # Collections untouched by the swap are reused as-is
+        assert after["teachers"] is before["teachers"]
+
+    def test_find_conflicting_assignments(self):
+        """Test that overlapping sections of one teacher are reported once per clash."""
+        self.create_unbalanced_scenario()
+        assert self.manager.find_conflicting_assignments() == []
+
+        # Move Chen's section onto Alice's Monday morning slot
+        self.manager.state.sections["MATH201-A"].timeslots = [
+            TimeSlot(day=1, start_hour=10.0, end_hour=12.0)
+        ]
+        self.manager.state.assignments["MATH201-A"].teacher_id = "t_alice"
+        self.manager.invalidate("sections", "assignments")
+
+        assert self.manager.find_conflicting_assignments() == [("t_alice", "MATH201-A")]
+
     def test_optimal_rebalancing_improves_balance(self):
         """Test that OR-Tools rebalancing improves load distribution."""
         self.create_unbalanced_scenario()
@@ -215,6 +271,7 @@ class TestRebalancing:
         # Clear all assignments and sections
         self.manager.state.assignments.clear()
         self.manager.state.sections.clear()
+        self.manager.invalidate("assignments", "sections")
 
         # Rebalancing should not crash
         result_state = self.manager.optimal_rebalance()
@@ -269,6 +326,7 @@ class TestRebalancing:
             "CS101-A": Assignment(section_id="CS101-A", teacher_id="t_alice"),
             "CS101-B": Assignment(section_id="CS101-B", teacher_id="t_bob"),
         }
+        self.manager.invalidate()
 
         # Run rebalancing
         self.manager.optimal_rebalance()